@@ -13,21 +13,56 @@ This client implementation:
 5. Adjusts sliding window based on received ACKs
 """
 
+import heapq
 import socket
+import selectors
+import struct
 import time
-import json
 import random
 import logging
-import threading
-from collections import deque, defaultdict
+import queue
+import atexit
+from array import array
+from itertools import compress
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging
+# Configure logging: records are queued by the calling thread and written to
+# stderr by a background listener, so the event loop never blocks on I/O
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger('TCP-Client')
 
+# Wire format: each packet is (seq_num, window_size), each cumulative ACK is the
+# next sequence number the server expects (ack_num)
+_PACKET = struct.Struct('!IH')
+_ACK = struct.Struct('!I')
+
+# Handshake: the client opens with HANDSHAKE and the server answers with
+# HANDSHAKE_REPLY, both sent as fixed-length frames
+HANDSHAKE = b'network'
+HANDSHAKE_REPLY = b'Connection setup success'
+
+# Socket send/receive buffer size (the kernel caps it at net.core.{w,r}mem_max)
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Record telemetry for visualization once per this many packets
+TELEMETRY_INTERVAL = 1000
+
+# Number of random bits drawn per drop decision
+DROP_RANDOM_BITS = 30
+
+# Flush buffered packets once this many bytes (64 packets) are pending
+SEND_BATCH_BYTES = 64 * _PACKET.size
+
 class TCPClient:
     """
     TCP Client implementing sliding window protocol sender functionality.
@@ -57,35 +92,56 @@ class TCPClient:
         self.max_seq_num = max_seq_num
         self.total_packets = total_packets
         
+        # A packet is dropped when DROP_RANDOM_BITS random bits fall below this threshold
+        self._drop_threshold = int(drop_probability * (1 << DROP_RANDOM_BITS))
+        
         # Socket setup
         self.client_socket = None
         
+        # Resolve the local address once instead of on every statistics snapshot
+        try:
+            self.local_ip = socket.gethostbyname(socket.gethostname())
+        except socket.error:
+            self.local_ip = '127.0.0.1'
+        
+        # Preallocated send buffer: packets are packed in place up to _out_len
+        self._out_buf = bytearray(SEND_BATCH_BYTES)
+        self._out_view = memoryview(self._out_buf)
+        self._out_len = 0
+        self._pack_into = _PACKET.pack_into
+        
+        # Receive buffer reused for every recv, holding ACK bytes up to _recv_tail
+        self._recv_buffer = bytearray(65536)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._recv_tail = 0
+        
         # Sliding window variables
         self.base = 0  # Base of the window
         self.next_seq_num = 0  # Next sequence number to be sent
         
         # Packet tracking
-        self.sent_packets = set()  # Set of sent sequence numbers
-        self.acked_packets = set()  # Set of acknowledged sequence numbers
-        self.dropped_packets = set()  # Set of dropped sequence numbers
-        self.packets_to_retransmit = deque()  # Queue of packets to retransmit
+        bitmap_size = (total_packets + 7) // 8
+        self.sent_bitmap = bytearray(bitmap_size)  # Bit per sent sequence number
+        self.acked_bitmap = bytearray(bitmap_size)  # Bit per acknowledged sequence number
+        self.acked_count = 0  # Number of bits set in acked_bitmap
+        self.dropped_bitmap = bytearray(bitmap_size)  # Bit per dropped sequence number
+        self.packets_to_retransmit = []  # Min-heap of (retransmit_after, seq_num) to retransmit
+        self.retransmit_deadlines = {}  # {seq_num: retransmit_after} for the live heap entry of each packet
         
         # Statistics
         self.total_sent = 0
         self.total_dropped = 0
         self.total_retransmitted = 0
         
-        # Window size tracking for visualization
-        self.window_sizes = []  # List to store window sizes over time
-        self.window_timestamps = []  # Timestamps for window size measurements
+        # Window size tracking for visualization, sampled every TELEMETRY_INTERVAL packets
+        self.window_sizes = array('H')  # Window sizes over time
+        self.window_timestamps = array('d')  # Timestamps for window size measurements
         
         # Retransmission statistics
-        self.retransmission_counts = defaultdict(int)  # {seq_num: retransmission_count}
+        self.retransmission_counts = array('B', bytes(total_packets))  # Retransmission count per sequence number
+        self.retransmission_histogram = [total_packets] + [0] * 255  # Number of packets per retransmission count
         
-        # Lock for thread safety
-        self.lock = threading.Lock()
-        
-        # Flag to control threads
+        # Flag to control the event loop
         self.running = False
     
     def connect(self):
@@ -97,16 +153,23 @@ class TCPClient:
         """
         try:
             self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            
+            # Send small packets immediately instead of waiting on Nagle, and set the
+            # buffer sizes before connecting so the TCP window scale accounts for them
+            self.client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            self.client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            
             self.client_socket.connect((self.server_host, self.server_port))
             
             # Send initial string to server
-            self.client_socket.send("network".encode())
+            self.client_socket.sendall(HANDSHAKE)
             
-            # Receive connection setup success message
-            response = self.client_socket.recv(1024).decode()
-            logger.info(f"Server response: {response}")
+            # Receive connection setup success message (the whole fixed-length reply)
+            response = self.client_socket.recv(len(HANDSHAKE_REPLY), socket.MSG_WAITALL)
+            logger.info("Server response: %s", response)
             
-            if "success" in response.lower():
+            if response == HANDSHAKE_REPLY:
                 logger.info(f"Connected to server at {self.server_host}:{self.server_port}")
                 return True
             else:
@@ -120,48 +183,36 @@ class TCPClient:
     def start(self):
         """
         Start the TCP client and begin sending packets.
+        
+        A single thread multiplexes sending, retransmission and ACK reception
+        with a selector on the client socket.
         """
         if not self.connect():
             return
         
         self.running = True
+        self._start_time = time.monotonic()  # Elapsed times use the monotonic clock
         
-        # Start thread to receive ACKs
-        ack_thread = threading.Thread(target=self.receive_acks)
-        ack_thread.daemon = True
-        ack_thread.start()
-        
-        # Start thread to handle retransmissions
-        retransmit_thread = threading.Thread(target=self.handle_retransmissions)
-        retransmit_thread.daemon = True
-        retransmit_thread.start()
-        
-        # Start sending packets
-        start_time = time.time()
+        selector = selectors.DefaultSelector()
+        selector.register(self.client_socket, selectors.EVENT_READ)
         
         try:
-            while self.total_sent < self.total_packets and self.running:
-                with self.lock:
-                    # Check if window is full
-                    if self.next_seq_num < self.base + self.window_size and self.next_seq_num < self.total_packets:
-                        # Send the next packet
-                        self.send_packet(self.next_seq_num)
-                        self.next_seq_num += 1
-                        
-                        # Record window size for visualization
-                        current_time = time.time() - start_time
-                        self.window_sizes.append(self.window_size)
-                        self.window_timestamps.append(current_time)
+            while self.running and self.acked_count < self.total_packets:
+                # Fill the window, retransmit due packets and send them in one batch
+                self.send_window()
+                self.handle_retransmissions()
+                self.flush_packets()
                 
-                # Sleep to prevent CPU overload
-                time.sleep(0.001)
-            
-            # Wait for all packets to be acknowledged
-            while len(self.acked_packets) < self.total_packets and self.running:
-                logger.info(f"Waiting for remaining ACKs... {len(self.acked_packets)}/{self.total_packets}")
-                time.sleep(1)
+                # Poll for ACKs, blocking only while the window is full and its
+                # base packet is in flight rather than waiting to be retransmitted
+                stalled = not self.can_send() and self.base not in self.retransmit_deadlines
+                if selector.select(timeout=1 if stalled else 0):
+                    self.receive_acks()
+                elif stalled and self.next_seq_num >= self.total_packets:
+                    logger.info("Waiting for remaining ACKs... %d/%d", self.acked_count, self.total_packets)
             
-            logger.info("All packets sent and acknowledged")
+            if self.acked_count == self.total_packets:
+                logger.info("All packets sent and acknowledged")
             
         except KeyboardInterrupt:
             logger.info("Client shutting down...")
@@ -169,133 +220,264 @@ class TCPClient:
             logger.error(f"Error: {e}")
         finally:
             self.running = False
+            selector.close()
             if self.client_socket:
                 self.client_socket.close()
             
             # Calculate and display final statistics
             self.calculate_final_statistics()
     
-    def send_packet(self, seq_num):
+    def send_window(self):
         """
-        Send a packet (sequence number) to the server.
+        Send new packets until the sliding window is full.
+        """
+        getrandbits = random.getrandbits
+        drop_threshold = self._drop_threshold
+        
+        while self.can_send():
+            seq_num = self.next_seq_num
+            self.next_seq_num += 1
+            window_size = self.window_size
+            
+            # Schedule a dropped packet for retransmission
+            should_drop = getrandbits(DROP_RANDOM_BITS) < drop_threshold
+            if should_drop:
+                self.schedule_retransmission(seq_num, seq_num + self.retransmit_after)
+            
+            self.send_packet(seq_num, window_size, should_drop)
+            
+            # Retransmit dropped packets as soon as next_seq_num reaches their deadline
+            if self.retransmission_due():
+                self.handle_retransmissions()
+            
+            # Record window size for visualization periodically
+            if seq_num % TELEMETRY_INTERVAL == 0:
+                self.window_sizes.append(window_size)
+                self.window_timestamps.append(time.monotonic() - self._start_time)
+    
+    def can_send(self):
+        """
+        Check whether the next packet fits in the sliding window.
+        
+        Returns:
+            bool: True if the next sequence number can be sent
+        """
+        return self.next_seq_num < self.base + self.window_size and self.next_seq_num < self.total_packets
+    
+    def retransmission_due(self):
+        """
+        Check whether the earliest packet in the retransmission heap is due.
+        
+        Returns:
+            bool: True if next_seq_num has reached the earliest deadline
+        """
+        if not self.packets_to_retransmit:
+            return False
+        
+        retransmit_after, _ = self.packets_to_retransmit[0]
+        return retransmit_after <= self.next_seq_num
+    
+    def blocked_on_retransmission(self):
+        """
+        Check whether the window is full behind a packet waiting to be retransmitted.
+        
+        next_seq_num cannot advance while the window is stuck behind its base,
+        so the base packet's deadline would never be reached.
+        
+        Returns:
+            bool: True if the base packet must be retransmitted before sending can continue
+        """
+        return not self.can_send() and self.base in self.retransmit_deadlines
+    
+    def is_acked(self, seq_num):
+        """
+        Check whether a sequence number has been acknowledged.
         
         Args:
-            seq_num (int): Sequence number to send
+            seq_num (int): Sequence number to check
+            
+        Returns:
+            bool: True if the sequence number is acknowledged
         """
-        # Check if we should drop this packet
-        should_drop = random.random() < self.drop_probability
+        return self.acked_bitmap[seq_num >> 3] & (1 << (seq_num & 7)) != 0
+    
+    def schedule_retransmission(self, seq_num, retransmit_after):
+        """
+        Queue a dropped packet for retransmission.
         
+        Args:
+            seq_num (int): Sequence number of the dropped packet
+            retransmit_after (int): Sequence number after which to retransmit
+        """
+        # Rescheduling supersedes the packet's earlier heap entry, which is skipped once popped
+        self.retransmit_deadlines[seq_num] = retransmit_after
+        heapq.heappush(self.packets_to_retransmit, (retransmit_after, seq_num))
+    
+    def send_packet(self, seq_num, window_size, should_drop):
+        """
+        Queue a packet (sequence number) to be sent to the server.
+        
+        The packet goes out with the next flush_packets() call.
+        
+        Args:
+            seq_num (int): Sequence number to send
+            window_size (int): Window size to report with the packet
+            should_drop (bool): Whether to simulate dropping this packet
+        """
         if should_drop:
-            # Simulate packet drop
-            logger.debug(f"Dropping packet with seq_num {seq_num}")
-            self.dropped_packets.add(seq_num)
+            # Simulate packet drop (send_window() has already scheduled the retransmission)
+            logger.debug("Dropping packet with seq_num %d", seq_num)
+            self.dropped_bitmap[seq_num >> 3] |= 1 << (seq_num & 7)
             self.total_dropped += 1
-            
-            # Schedule for retransmission
-            self.packets_to_retransmit.append((seq_num, self.next_seq_num + self.retransmit_after))
         else:
-            # Send the packet
-            try:
-                message = json.dumps({
-                    'seq_num': seq_num,
-                    'window_size': self.window_size
-                })
-                self.client_socket.send(message.encode())
-                self.sent_packets.add(seq_num)
-                self.total_sent += 1
-                
-                if seq_num % 1000 == 0:
-                    logger.info(f"Sent packet with seq_num {seq_num}")
+            # Buffer the packet
+            self.queue_packet(seq_num, window_size)
+            self.sent_bitmap[seq_num >> 3] |= 1 << (seq_num & 7)
+            self.total_sent += 1
             
-            except Exception as e:
-                logger.error(f"Error sending packet: {e}")
+            if seq_num % 1000 == 0:
+                logger.info("Sent packet with seq_num %d", seq_num)
+    
+    def queue_packet(self, seq_num, window_size):
+        """
+        Pack a packet into the send buffer, flushing the buffer once it is full.
+        
+        Args:
+            seq_num (int): Sequence number to send
+            window_size (int): Window size to report with the packet
+        """
+        self._pack_into(self._out_buf, self._out_len, seq_num, window_size)
+        self._out_len += _PACKET.size
+        if self._out_len == SEND_BATCH_BYTES:
+            self.flush_packets()
+    
+    def flush_packets(self):
+        """
+        Send all buffered packets to the server in a single call.
+        """
+        if not self._out_len:
+            return
+        
+        try:
+            self.client_socket.sendall(self._out_view[:self._out_len])
+        except Exception as e:
+            logger.error(f"Error sending packets: {e}")
+        finally:
+            self._out_len = 0
+    
+    def mark_acked_range(self, start, end):
+        """
+        Mark every sequence number in [start, end) as acknowledged.
+        
+        Args:
+            start (int): First sequence number to mark
+            end (int): One past the last sequence number to mark
+        """
+        acked_bitmap = self.acked_bitmap
+        
+        # Set single bits up to a byte boundary, whole bytes, then the remaining bits
+        while start < end and start & 7:
+            acked_bitmap[start >> 3] |= 1 << (start & 7)
+            start += 1
+        whole_end = end & ~7
+        if start < whole_end:
+            acked_bitmap[start >> 3:whole_end >> 3] = b'\xff' * ((whole_end - start) >> 3)
+            start = whole_end
+        while start < end:
+            acked_bitmap[start >> 3] |= 1 << (start & 7)
+            start += 1
     
     def receive_acks(self):
         """
-        Continuously receive ACKs from the server and adjust the sliding window.
+        Receive the cumulative ACKs waiting on the socket and slide the window.
         """
-        while self.running:
-            try:
-                # Receive ACK from server
-                data = self.client_socket.recv(4096)
-                if not data:
-                    break
-                
-                # Parse ACK
-                message = json.loads(data.decode())
-                ack_num = message.get('ack_num')
-                
-                if ack_num is not None:
-                    with self.lock:
-                        # The ACK number is the next expected sequence number
-                        seq_num = ack_num - 1
-                        
-                        # Mark packet as acknowledged
-                        if seq_num not in self.acked_packets:
-                            self.acked_packets.add(seq_num)
-                            
-                            # If this was the base of the window, move the window forward
-                            if seq_num == self.base:
-                                # Find the new base (next unacknowledged packet)
-                                while self.base in self.acked_packets and self.base < self.next_seq_num:
-                                    self.base += 1
-                                
-                                # Increase window size (simple congestion control)
-                                if self.window_size < 100:  # Maximum window size
-                                    self.window_size += 1
-                            
-                            if seq_num % 1000 == 0:
-                                logger.info(f"Received ACK for seq_num {seq_num}, window: [{self.base}, {self.base + self.window_size})")
-                
-            except json.JSONDecodeError:
-                logger.error("Invalid JSON data received")
-            except Exception as e:
-                logger.error(f"Error receiving ACK: {e}")
-                break
+        try:
+            received = self.client_socket.recv_into(self._recv_view[self._recv_tail:])
+        except Exception as e:
+            logger.error(f"Error receiving ACK: {e}")
+            self.running = False
+            return
+        
+        if not received:
+            logger.error("Connection closed by server")
+            self.running = False
+            return
+        tail = self._recv_tail + received
+        
+        # Only the highest cumulative ACK in the buffer matters; decode every
+        # complete ACK in one call
+        recv_buffer = self._recv_buffer
+        end = tail - tail % _ACK.size
+        ack_num = max(_ACK.iter_unpack(self._recv_view[:end]), default=(0,))[0]
+        
+        # Move a partially received ACK to the front of the buffer
+        leftover = tail - end
+        recv_buffer[:leftover] = recv_buffer[end:tail]
+        self._recv_tail = leftover
+        
+        # The ACK number is the next expected sequence number, so everything
+        # below it is acknowledged
+        old_base = self.base
+        if ack_num <= old_base:
+            return
+        self.mark_acked_range(old_base, ack_num)
+        self.acked_count += ack_num - old_base
+        self.base = ack_num
+        
+        # Increase window size by one per newly acknowledged packet (simple congestion
+        # control), growing no further than 100 but never shrinking a larger initial window
+        if self.window_size < 100:  # Maximum window size
+            self.window_size = min(self.window_size + ack_num - old_base, 100)
+        
+        if old_base // 1000 != ack_num // 1000:
+            logger.info("Received ACK %d, window: [%d, %d)", ack_num, ack_num, self.base + self.window_size)
     
     def handle_retransmissions(self):
         """
-        Handle retransmission of dropped packets.
-        """
-        while self.running:
-            try:
-                with self.lock:
-                    # Check if there are packets to retransmit
-                    if self.packets_to_retransmit:
-                        seq_num, retransmit_after = self.packets_to_retransmit[0]
-                        
-                        # Check if it's time to retransmit
-                        if retransmit_after <= self.next_seq_num:
-                            # Remove from queue
-                            self.packets_to_retransmit.popleft()
-                            
-                            # Check if already acknowledged
-                            if seq_num not in self.acked_packets:
-                                # Retransmit with same drop probability
-                                should_drop = random.random() < self.drop_probability
-                                
-                                if should_drop:
-                                    # Packet dropped again, reschedule
-                                    logger.debug(f"Retransmission of seq_num {seq_num} dropped again")
-                                    self.packets_to_retransmit.append((seq_num, self.next_seq_num + self.retransmit_after))
-                                else:
-                                    # Retransmit the packet
-                                    logger.debug(f"Retransmitting seq_num {seq_num}")
-                                    message = json.dumps({
-                                        'seq_num': seq_num,
-                                        'window_size': self.window_size
-                                    })
-                                    self.client_socket.send(message.encode())
-                                    self.total_retransmitted += 1
-                                    
-                                    # Update retransmission statistics
-                                    self.retransmission_counts[seq_num] += 1
-                
-                # Sleep to prevent CPU overload
-                time.sleep(0.01)
+        Queue every dropped packet that is due for retransmission.
+        """
+        getrandbits = random.getrandbits
+        drop_threshold = self._drop_threshold
+        
+        heap = self.packets_to_retransmit
+        deadlines = self.retransmit_deadlines
+        
+        # A window stuck behind its base makes the base packet due now
+        if self.blocked_on_retransmission() and deadlines[self.base] > self.next_seq_num:
+            self.schedule_retransmission(self.base, self.next_seq_num)
+        
+        # Take every due packet off the heap that is still unacknowledged, skipping
+        # superseded entries; packets dropped again are rescheduled for a later pass
+        due = []
+        while self.retransmission_due():
+            retransmit_after, seq_num = heapq.heappop(heap)
+            if deadlines.get(seq_num) != retransmit_after:
+                continue
+            del deadlines[seq_num]
+            if not self.is_acked(seq_num):
+                due.append(seq_num)
+        
+        for seq_num in due:
+            # Retransmit with same drop probability
+            should_drop = getrandbits(DROP_RANDOM_BITS) < drop_threshold
+            
+            if should_drop:
+                # Packet dropped again, reschedule
+                logger.debug("Retransmission of seq_num %d dropped again", seq_num)
+                self.schedule_retransmission(seq_num, self.next_seq_num + self.retransmit_after)
+            else:
+                # Retransmit the packet
+                logger.debug("Retransmitting seq_num %d", seq_num)
+                self.queue_packet(seq_num, self.window_size)
+                self.total_retransmitted += 1
                 
-            except Exception as e:
-                logger.error(f"Error handling retransmissions: {e}")
+                # Update retransmission statistics (saturating at the byte limit), moving
+                # the packet to the next histogram bucket
+                count = self.retransmission_counts[seq_num]
+                if count < 255:
+                    self.retransmission_counts[seq_num] = count + 1
+                    self.retransmission_histogram[count] -= 1
+                    self.retransmission_histogram[count + 1] += 1
     
     def calculate_final_statistics(self):
         """
@@ -305,15 +487,11 @@ class TCPClient:
         logger.info(f"Total packets sent: {self.total_sent}")
         logger.info(f"Total packets dropped: {self.total_dropped}")
         logger.info(f"Total packets retransmitted: {self.total_retransmitted}")
-        logger.info(f"Total packets acknowledged: {len(self.acked_packets)}")
+        logger.info(f"Total packets acknowledged: {self.acked_count}")
         
-        # Calculate retransmission statistics
-        retransmission_table = {}
+        # Report retransmission statistics from the histogram kept during the run
         for count in range(1, 5):  # 1 to 4 retransmissions
-            packets_with_count = sum(1 for seq_num, retrans_count in self.retransmission_counts.items() 
-                                    if retrans_count == count)
-            retransmission_table[count] = packets_with_count
-            logger.info(f"Packets with {count} retransmissions: {packets_with_count}")
+            logger.info("Packets with %d retransmissions: %d", count, self.retransmission_histogram[count])
     
     def get_statistics(self):
         """
@@ -322,18 +500,22 @@ class TCPClient:
         Returns:
             dict: Dictionary containing client statistics
         """
-        with self.lock:
-            stats = {
-                'client_address': f"{socket.gethostbyname(socket.gethostname())}",
-                'server_address': f"{self.server_host}:{self.server_port}",
-                'total_sent': self.total_sent,
-                'total_dropped': self.total_dropped,
-                'total_retransmitted': self.total_retransmitted,
-                'total_acked': len(self.acked_packets),
-                'window_sizes': self.window_sizes,
-                'window_timestamps': self.window_timestamps,
-                'retransmission_counts': dict(self.retransmission_counts)
-            }
+        # Only the event loop thread writes these fields, and each one is read
+        # atomically, so a snapshot never blocks packet processing
+        counts = self.retransmission_counts
+        stats = {
+            'client_address': self.local_ip,
+            'server_address': f"{self.server_host}:{self.server_port}",
+            'total_sent': self.total_sent,
+            'total_dropped': self.total_dropped,
+            'total_retransmitted': self.total_retransmitted,
+            'total_acked': self.acked_count,
+            'window_sizes': self.window_sizes.tolist(),
+            'window_timestamps': self.window_timestamps.tolist(),
+            # Every retransmitted sequence number and, in the same order, its retransmission count
+            'retransmission_seq_nums': list(compress(range(len(counts)), counts)),
+            'retransmission_attempt_counts': list(compress(counts, counts))
+        }
         
         return stats
 
@@ -355,6 +537,10 @@ def main():
     
     args = parser.parse_args()
     
+    # The window size is sent with every packet as an unsigned 16-bit field
+    if not 1 <= args.window <= 0xFFFF:
+        parser.error(f"--window must be between 1 and {0xFFFF}")
+    
     # Create and start the client
     client = TCPClient(
         server_host=args.host,
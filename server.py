@@ -14,19 +14,74 @@ This server implementation:
 """
 
 import socket
+import selectors
+import struct
 import time
-import json
 import threading
 import logging
+import queue
+import atexit
+import gc
+from array import array
 from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging
+# Configure logging: records are queued by the calling thread and written to
+# stderr by a background listener, so the event loop never blocks on I/O
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger('TCP-Server')
 
+# Wire format: each packet is (seq_num, window_size), each cumulative ACK is the
+# next sequence number the server expects (ack_num)
+_PACKET = struct.Struct('!IH')
+_ACK = struct.Struct('!I')
+
+# Handshake: the client opens with HANDSHAKE and the server answers with
+# HANDSHAKE_REPLY, both sent as fixed-length frames
+HANDSHAKE = b'network'
+HANDSHAKE_REPLY = b'Connection setup success'
+
+# The received bitmap is scanned 64 sequence numbers (one little-endian word) at a time
+_WORD = struct.Struct('<Q')
+_FULL_WORD = (1 << 64) - 1
+
+# Socket send/receive buffer size (the kernel caps it at net.core.{w,r}mem_max)
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Record telemetry for visualization once per this many packets
+TELEMETRY_INTERVAL = 1000
+
+class ClientConnection:
+    """
+    Receive state of one client connection.
+    """
+    
+    def __init__(self, client_address):
+        """
+        Initialize the state of a new connection.
+        
+        Args:
+            client_address (tuple): Client address information (ip, port)
+        """
+        self.client_address = client_address
+        self.start_time = None  # Start time for statistics, set once the handshake is done
+        
+        # Receive buffer reused for every recv
+        self.recv_buffer = bytearray(65536)
+        self.recv_view = memoryview(self.recv_buffer)
+        self.tail = 0  # End of the received bytes in recv_buffer
+        self.last_ack_num = 0  # Last cumulative ACK sent to the client
+
 class TCPServer:
     """
     TCP Server implementing sliding window protocol receiver functionality.
@@ -48,162 +103,285 @@ class TCPServer:
         # Socket setup
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        
+        # Accepted sockets inherit the listening socket's buffer sizes
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
         
         # Data structures for tracking packets
-        self.received_packets = set()  # Set of received sequence numbers
-        self.missing_packets = set()   # Set of missing sequence numbers
+        self.received_bitmap = bytearray(8192)  # Bit per received sequence number, grown on demand in whole words
+        self.missing_count = 0          # Number of sequence numbers found missing
         self.highest_seq_received = -1  # Highest sequence number received
+        self.next_expected_seq = 0  # Cumulative ACK: every lower sequence number is received
         
         # Statistics
         self.total_packets_received = 0
         self.total_packets_expected = 0
-        self.goodput_measurements = []  # List to store goodput measurements
-        self.measurement_timestamps = []  # Timestamps for measurements
+        self.goodput_measurements = array('d')  # Goodput measurements
+        self.measurement_timestamps = array('d')  # Timestamps for measurements
         
         # Window size tracking for visualization
-        self.window_sizes = []  # List to store window sizes over time
-        self.window_timestamps = []  # Timestamps for window size measurements
+        self.window_sizes = array('H')  # Window sizes over time
+        self.window_timestamps = array('d')  # Timestamps for window size measurements
         
         # Sequence number tracking for visualization
-        self.seq_nums_received = []  # List of sequence numbers received over time
-        self.seq_nums_dropped = []   # List of sequence numbers dropped over time
-        self.seq_timestamps = []     # Timestamps for sequence number tracking
+        self.seq_nums_received = array('I')  # Sequence numbers received over time
+        self.seq_nums_dropped = array('I')   # Sequence numbers dropped over time
+        self.seq_timestamps = array('d')     # Timestamps for sequence number tracking
         
         # Retransmission statistics
         self.retransmission_stats = defaultdict(int)  # {seq_num: retransmission_count}
         
-        # Lock for thread safety
+        # Lock for reading the statistics from other threads
         self.lock = threading.Lock()
         
+        # Selector multiplexing the listening socket and every client socket
+        self.selector = selectors.DefaultSelector()
+        
         # Client information
         self.client_address = None
     
     def start(self):
         """
         Start the TCP server and listen for connections.
+        
+        Every client socket is read by one selector loop on the calling thread.
         """
         try:
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(1)
+            self.selector.register(self.server_socket, selectors.EVENT_READ)
             logger.info(f"Server started on {self.host}:{self.port}")
             
+            # Move everything allocated so far out of the collector's view and stop
+            # automatic collections while serving; each connection collects once
+            # when it closes, so cyclic garbage stays bounded
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+            
             while True:
-                client_socket, client_address = self.server_socket.accept()
-                self.client_address = client_address
-                logger.info(f"Connection established with {client_address}")
-                
-                # Handle client connection in a new thread
-                client_thread = threading.Thread(
-                    target=self.handle_client,
-                    args=(client_socket, client_address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
+                for key, _ in self.selector.select():
+                    if key.data is None:
+                        self.accept_client()
+                    else:
+                        self.handle_client(key.fileobj, key.data)
                 
         except KeyboardInterrupt:
             logger.info("Server shutting down...")
         except Exception as e:
             logger.error(f"Error: {e}")
         finally:
+            self.selector.close()
             self.server_socket.close()
+            gc.enable()
     
-    def handle_client(self, client_socket, client_address):
+    def accept_client(self):
+        """
+        Accept a pending connection and register it with the selector.
         """
-        Handle client connection and implement the sliding window protocol.
+        client_socket, client_address = self.server_socket.accept()
+        self.client_address = client_address
+        logger.info(f"Connection established with {client_address}")
+        
+        # Send small packets and ACKs immediately instead of waiting on Nagle
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        self.selector.register(client_socket, selectors.EVENT_READ, ClientConnection(client_address))
+    
+    def handle_client(self, client_socket, connection):
+        """
+        Handle data from a readable client socket and implement the sliding window protocol.
         
         Args:
             client_socket (socket): Socket object for client connection
-            client_address (tuple): Client address information (ip, port)
+            connection (ClientConnection): Receive state of the connection
         """
         try:
-            # Send connection setup success message
-            client_socket.send("Connection setup success".encode())
+            # Receive data from client (the selector reported it readable, so this cannot block)
+            received = client_socket.recv_into(connection.recv_view[connection.tail:])
+        except OSError as e:
+            logger.error("Error handling client: %s", e)
+            received = 0
+        
+        if not received:
+            self.close_client(client_socket, connection)
+            return
+        
+        tail = connection.tail + received
+        
+        # First, receive the whole fixed-length initial string from client
+        if connection.start_time is None:
+            if tail < len(HANDSHAKE):
+                connection.tail = tail
+                return
             
-            # Start time for statistics
-            start_time = time.time()
-            last_measurement_time = start_time
+            initial_data = bytes(connection.recv_buffer[:len(HANDSHAKE)])
+            if initial_data != HANDSHAKE:
+                logger.error("Invalid initial message from client: %s", initial_data)
+                self.close_client(client_socket, connection)
+                return
             
-            while True:
-                # Receive data from client
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-                
-                # Parse received data
-                try:
-                    message = json.loads(data.decode())
-                    seq_num = message.get('seq_num')
-                    window_size = message.get('window_size', 0)
-                    
-                    # Process the sequence number
-                    with self.lock:
-                        self.process_sequence_number(seq_num)
-                        
-                        # Track window size for visualization
-                        current_time = time.time() - start_time
-                        self.window_sizes.append(window_size)
-                        self.window_timestamps.append(current_time)
-                        
-                        # Calculate and record goodput periodically (every 1000 packets)
-                        if self.total_packets_received % 1000 == 0 and self.total_packets_received > 0:
-                            goodput = len(self.received_packets) / self.total_packets_expected
-                            self.goodput_measurements.append(goodput)
-                            self.measurement_timestamps.append(current_time)
-                            logger.info(f"Goodput after {self.total_packets_received} packets: {goodput:.4f}")
-                    
-                    # Send ACK back to client
-                    ack_message = json.dumps({'ack_num': seq_num + 1})
-                    client_socket.send(ack_message.encode())
-                    
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON data received")
-                except Exception as e:
-                    logger.error(f"Error processing data: {e}")
+            logger.info("Received initial message: %s", initial_data)
+            
+            # Send connection setup success message
+            client_socket.sendall(HANDSHAKE_REPLY)
+            
+            # Start time for statistics (elapsed times use the monotonic clock)
+            connection.start_time = time.monotonic()
+            connection.tail = 0
+            return
         
+        # Process every complete packet in the buffer
+        try:
+            end = tail - tail % _PACKET.size
+            self.process_packets(connection.recv_view[:end], connection.start_time)
+            
+            # Move a partially received packet to the front of the buffer
+            connection.recv_buffer[:tail - end] = connection.recv_buffer[end:tail]
+            tail -= end
+            
+            # Send one cumulative ACK for the whole batch before waiting for more
+            # data, so a client with a full window is never left waiting
+            ack_num = self.next_expected_seq
+            if ack_num != connection.last_ack_num:
+                client_socket.sendall(_ACK.pack(ack_num))
+                connection.last_ack_num = ack_num
+            
         except Exception as e:
-            logger.error(f"Error handling client: {e}")
+            logger.error("Error processing data: %s", e)
         finally:
-            client_socket.close()
-            logger.info(f"Connection with {client_address} closed")
-            
-            # Calculate final statistics
-            self.calculate_final_statistics()
+            connection.tail = tail
     
-    def process_sequence_number(self, seq_num):
+    def close_client(self, client_socket, connection):
+        """
+        Close a client connection and calculate the final statistics.
+        
+        Args:
+            client_socket (socket): Socket object for client connection
+            connection (ClientConnection): Receive state of the connection
+        """
+        self.selector.unregister(client_socket)
+        client_socket.close()
+        logger.info("Connection with %s closed", connection.client_address)
+        
+        # Calculate final statistics
+        self.calculate_final_statistics()
+        
+        # Automatic collection is disabled while serving (see start)
+        gc.collect()
+    
+    def process_packets(self, packets, start_time):
+        """
+        Process a batch of complete packets received from the client.
+        
+        The lock is taken once for the whole batch.
+        
+        Args:
+            packets (memoryview): Whole packets in wire format
+            start_time (float): Connection start time, for telemetry timestamps
+        """
+        # Bind the per-packet callable once instead of looking it up per packet
+        process_sequence_number = self.process_sequence_number
+        
+        # Read the clock once per batch: every telemetry sample in it shares the timestamp
+        current_time = time.monotonic() - start_time
+        
+        with self.lock:
+            for seq_num, window_size in _PACKET.iter_unpack(packets):
+                process_sequence_number(seq_num, current_time)
+                
+                # Track window size and goodput for visualization periodically
+                if self.total_packets_received % TELEMETRY_INTERVAL != 0 or self.total_packets_received == 0:
+                    continue
+                
+                self.window_sizes.append(window_size)
+                self.window_timestamps.append(current_time)
+                
+                goodput = self.total_packets_received / self.total_packets_expected
+                self.goodput_measurements.append(goodput)
+                self.measurement_timestamps.append(current_time)
+                logger.info("Goodput after %d packets: %.4f", self.total_packets_received, goodput)
+    
+    def process_sequence_number(self, seq_num, current_time):
         """
         Process a received sequence number.
         
         Args:
             seq_num (int): The sequence number received from client
+            current_time (float): Elapsed time of the batch, for telemetry timestamps
         """
         # Update statistics
         self.total_packets_expected += 1
         
+        # Grow the bitmap (at least doubling it, in whole words) to cover seq_num
+        received_bitmap = self.received_bitmap
+        index = seq_num >> 3
+        mask = 1 << (seq_num & 7)
+        if index >= len(received_bitmap):
+            received_bitmap.extend(bytes((index + 8) & ~7))
+        
         # Check if this is a new sequence number or a retransmission
-        if seq_num in self.received_packets:
+        if received_bitmap[index] & mask:
             # This is a retransmission
             self.retransmission_stats[seq_num] += 1
         else:
             # This is a new sequence number
             self.total_packets_received += 1
-            self.received_packets.add(seq_num)
+            received_bitmap[index] |= mask
             
-            # Track sequence numbers for visualization
-            current_time = time.time()
-            self.seq_nums_received.append(seq_num)
-            self.seq_timestamps.append(current_time)
+            # Advance the cumulative ACK past every in-order sequence number
+            if seq_num == self.next_expected_seq:
+                self.next_expected_seq = self.first_missing_seq(seq_num + 1)
+            
+            # Track sequence numbers for visualization periodically
+            if self.total_packets_received % TELEMETRY_INTERVAL == 0:
+                self.seq_nums_received.append(seq_num)
+                self.seq_timestamps.append(current_time)
             
             # Update highest sequence number received
             if seq_num > self.highest_seq_received:
-                # Check for missing packets
-                for i in range(self.highest_seq_received + 1, seq_num):
-                    if i not in self.received_packets and i not in self.missing_packets:
-                        self.missing_packets.add(i)
-                        # Track dropped packets for visualization
-                        self.seq_nums_dropped.append(i)
+                # Every sequence number skipped over is missing: nothing above the
+                # previous highest has been received, so no membership test is needed
+                gap_start = self.highest_seq_received + 1
+                if seq_num > gap_start:
+                    self.missing_count += seq_num - gap_start
+                    # Track dropped packets for visualization
+                    self.seq_nums_dropped.extend(range(gap_start, seq_num))
                 
                 self.highest_seq_received = seq_num
     
+    def first_missing_seq(self, start):
+        """
+        Find the lowest sequence number at or above start that is not received.
+        
+        Scans the bitmap a 64-bit word at a time: bits below start are masked
+        to ones, and the first zero bit of a word is located by isolating the
+        lowest set bit of its complement.
+        
+        Args:
+            start (int): Sequence number to start scanning from
+            
+        Returns:
+            int: The first sequence number not yet received
+        """
+        received_bitmap = self.received_bitmap
+        word_count = len(received_bitmap) >> 3
+        word_index = start >> 6
+        low_bits = (1 << (start & 63)) - 1
+        
+        while word_index < word_count:
+            word = _WORD.unpack_from(received_bitmap, word_index << 3)[0] | low_bits
+            if word != _FULL_WORD:
+                missing = ~word & _FULL_WORD
+                return (word_index << 6) + (missing & -missing).bit_length() - 1
+            word_index += 1
+            low_bits = 0
+        
+        return word_count << 6
+    
     def calculate_final_statistics(self):
         """
         Calculate and log final statistics.
@@ -212,14 +390,14 @@ class TCPServer:
             logger.warning("No packets were processed")
             return
         
-        final_goodput = len(self.received_packets) / self.total_packets_expected
+        final_goodput = self.total_packets_received / self.total_packets_expected
         
         logger.info("=== Final Statistics ===")
-        logger.info(f"Total packets expected: {self.total_packets_expected}")
-        logger.info(f"Total packets received: {self.total_packets_received}")
-        logger.info(f"Missing packets: {len(self.missing_packets)}")
-        logger.info(f"Final goodput: {final_goodput:.4f}")
-        logger.info(f"Number of retransmissions: {sum(self.retransmission_stats.values())}")
+        logger.info("Total packets expected: %d", self.total_packets_expected)
+        logger.info("Total packets received: %d", self.total_packets_received)
+        logger.info("Missing packets: %d", self.missing_count)
+        logger.info("Final goodput: %.4f", final_goodput)
+        logger.info("Number of retransmissions: %d", sum(self.retransmission_stats.values()))
     
     def get_statistics(self):
         """
@@ -234,14 +412,14 @@ class TCPServer:
                 'client_address': self.client_address,
                 'total_packets_expected': self.total_packets_expected,
                 'total_packets_received': self.total_packets_received,
-                'missing_packets': len(self.missing_packets),
-                'goodput_measurements': self.goodput_measurements,
-                'measurement_timestamps': self.measurement_timestamps,
-                'window_sizes': self.window_sizes,
-                'window_timestamps': self.window_timestamps,
-                'seq_nums_received': self.seq_nums_received,
-                'seq_nums_dropped': self.seq_nums_dropped,
-                'seq_timestamps': self.seq_timestamps,
+                'missing_packets': self.missing_count,
+                'goodput_measurements': self.goodput_measurements.tolist(),
+                'measurement_timestamps': self.measurement_timestamps.tolist(),
+                'window_sizes': self.window_sizes.tolist(),
+                'window_timestamps': self.window_timestamps.tolist(),
+                'seq_nums_received': self.seq_nums_received.tolist(),
+                'seq_nums_dropped': self.seq_nums_dropped.tolist(),
+                'seq_timestamps': self.seq_timestamps.tolist(),
                 'retransmission_stats': dict(self.retransmission_stats)
             }
         
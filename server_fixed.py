@@ -10,27 +10,373 @@ This server implementation:
 4. Sends ACK numbers back to the client
 5. Calculates and reports goodput statistics
 """
+import asyncio
 import socket
+import struct
 import time
-import json
 import threading
 import logging
+import queue
+import atexit
+import gc
 import os
+import signal
+import multiprocessing
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from stats_json import load_json, save_json, save_arrays, load_arrays, remove_arrays
 
-# Configure logging
+# uvloop is optional: asyncio's own event loop is used without it. uvloop.run
+# (uvloop 0.18 or later) creates its loop directly rather than through the
+# event loop policy API deprecated since Python 3.12
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+run_event_loop = getattr(uvloop, 'run', asyncio.run)
+
+# Configure logging: records are queued by the calling thread and written to
+# stderr by a background listener, so the event loop never blocks on I/O
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger('TCP-Server')
 
+# Wire format: each packet is (seq_num, window_size), each cumulative ACK is the
+# next sequence number the server expects (ack_num)
+_PACKET = struct.Struct('!IH')
+_ACK = struct.Struct('!I')
+
+# Handshake: the client opens with HANDSHAKE and the server answers with
+# HANDSHAKE_REPLY, both sent as fixed-length frames
+HANDSHAKE = b'network'
+HANDSHAKE_REPLY = b'Connection setup success'
+
+# Socket send/receive buffer size (the kernel caps it at net.core.{w,r}mem_max)
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Record telemetry for visualization once per this many packets
+TELEMETRY_INTERVAL = 1000
+
+# Seconds a stopped worker process gets to save its statistics before it is killed
+WORKER_STOP_TIMEOUT = 10
+
+class ClientState:
+    """
+    Receiver state for one client connection.
+    
+    Each state is owned by its connection's protocol, so packets are processed
+    without locking; the totals are merged into the server when the connection
+    closes.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the per-connection state.
+        """
+        # Data structures for tracking packets
+        self.received_count = 0  # Number of distinct sequence numbers received
+        self.missing_count = 0
+        self.missing_intervals = []  # Sorted, disjoint (start, end) ranges still missing
+        self.highest_seq_num = -1
+        self.next_expected_seq = 0  # Cumulative ACK: every lower sequence number is received
+        self.total_packets_received = 0
+        self.total_packets_expected = 0
+        
+        # Statistics for visualization (elapsed times use the monotonic clock)
+        self.start_time = time.monotonic()
+        self.window_sizes = array('H')
+        self.window_timestamps = array('d')
+        self.seq_nums_received = array('I')
+        self.seq_nums_timestamps = array('d')
+        self.seq_nums_dropped = array('I')
+        self.goodput_measurements = array('d')
+        self.goodput_timestamps = array('d')
+    
+    def process_packets(self, packets):
+        """
+        Process a batch of complete packets received from the client.
+        
+        Args:
+            packets (memoryview): Whole packets in wire format
+        """
+        # Bind the per-packet callable once instead of looking it up per packet
+        process_sequence_number = self.process_sequence_number
+        
+        # Read the clock once per batch: every telemetry sample in it shares the timestamp
+        current_time = time.monotonic() - self.start_time
+        
+        next_seq = self.highest_seq_num + 1
+        received = self.total_packets_received
+        in_order = 0  # Fast-path packets not yet added to the counters
+        
+        for seq_num, window_size in _PACKET.iter_unpack(packets):
+            # Fast path: the next in-order packet only advances local counters,
+            # unless a telemetry sample is due
+            if seq_num == next_seq and (received + 1) % TELEMETRY_INTERVAL:
+                next_seq += 1
+                received += 1
+                in_order += 1
+                continue
+            
+            if in_order:
+                self.advance_in_order(in_order)
+                in_order = 0
+            process_sequence_number(seq_num, current_time)
+            next_seq = self.highest_seq_num + 1
+            received = self.total_packets_received
+            
+            # Track window size and goodput for visualization periodically
+            if self.total_packets_received % TELEMETRY_INTERVAL != 0 or self.total_packets_received == 0:
+                continue
+            
+            self.window_sizes.append(window_size)
+            self.window_timestamps.append(current_time)
+            
+            goodput = self.received_count / self.total_packets_expected
+            self.goodput_measurements.append(goodput)
+            self.goodput_timestamps.append(current_time)
+            logger.info("Goodput: %.4f (%d/%d)", goodput, self.received_count, self.total_packets_expected)
+        
+        if in_order:
+            self.advance_in_order(in_order)
+        
+        # The cumulative ACK is the start of the lowest missing range
+        if self.missing_intervals:
+            self.next_expected_seq = self.missing_intervals[0][0]
+        else:
+            self.next_expected_seq = self.highest_seq_num + 1
+    
+    def advance_in_order(self, count):
+        """
+        Account for a run of packets that each arrived as the next highest one.
+        
+        Equivalent to calling process_sequence_number() for each of them when
+        none falls on a telemetry sample.
+        
+        Args:
+            count (int): Number of packets in the run
+        """
+        self.highest_seq_num += count
+        self.total_packets_expected = self.highest_seq_num + 1
+        self.total_packets_received += count
+        self.received_count += count
+    
+    def process_sequence_number(self, seq_num, current_time):
+        """
+        Process received sequence number and track missing packets.
+        
+        Args:
+            seq_num (int): Received sequence number
+            current_time (float): Elapsed time of the batch, for telemetry timestamps
+        """
+        if seq_num is None:
+            return
+        
+        self.total_packets_received += 1
+        
+        # Record sequence number and timestamp periodically
+        if self.total_packets_received % TELEMETRY_INTERVAL == 0:
+            self.seq_nums_received.append(seq_num)
+            self.seq_nums_timestamps.append(current_time)
+        
+        # Update highest sequence number
+        gap_start = self.highest_seq_num + 1
+        if seq_num >= gap_start:
+            # Update expected packets count
+            self.total_packets_expected = seq_num + 1
+            
+            # Every sequence number skipped over is missing: nothing above the
+            # previous highest has been received, so no membership test is needed
+            if seq_num > gap_start:
+                self.missing_count += seq_num - gap_start
+                self.seq_nums_dropped.extend(range(gap_start, seq_num))
+                self.missing_intervals.append((gap_start, seq_num))
+            
+            self.highest_seq_num = seq_num
+            self.received_count += 1
+        elif self.fill_missing(seq_num):
+            # A retransmission filled a hole; anything else below highest is a duplicate
+            self.received_count += 1
+    
+    def fill_missing(self, seq_num):
+        """
+        Remove a late (retransmitted) sequence number from the missing ranges.
+        
+        Args:
+            seq_num (int): Received sequence number below the highest one
+            
+        Returns:
+            bool: True if seq_num was missing, False if it is a duplicate
+        """
+        intervals = self.missing_intervals
+        
+        # Find the last range starting at or before seq_num
+        index = bisect_left(intervals, (seq_num + 1,)) - 1
+        if index < 0:
+            return False
+        start, end = intervals[index]
+        if seq_num >= end:
+            return False
+        
+        # Shrink, split or drop the range
+        if start == seq_num and end == seq_num + 1:
+            del intervals[index]
+        elif start == seq_num:
+            intervals[index] = (seq_num + 1, end)
+        elif end == seq_num + 1:
+            intervals[index] = (start, seq_num)
+        else:
+            intervals[index:index + 1] = [(start, seq_num), (seq_num + 1, end)]
+        
+        return True
+
+class ClientProtocol(asyncio.BufferedProtocol):
+    """
+    asyncio protocol serving one client connection.
+    
+    The event loop receives directly into the protocol's buffer, and each
+    batch of complete packets is answered with one cumulative ACK.
+    """
+    
+    def __init__(self, server):
+        """
+        Initialize the protocol for a new connection.
+        
+        Args:
+            server (TCPServer): Server that collects the connection's statistics
+        """
+        self.server = server
+        self.transport = None
+        self.client_address = None
+        self.state = None  # Packet tracking, created once the handshake is done
+        
+        # Receive buffer reused for every read
+        self.recv_buffer = bytearray(65536)
+        self.recv_view = memoryview(self.recv_buffer)
+        self.tail = 0  # End of the received bytes in recv_buffer
+        self.last_ack_num = 0  # Last cumulative ACK sent to the client
+    
+    def connection_made(self, transport):
+        """
+        Record the new connection (asyncio enables TCP_NODELAY on it).
+        
+        Args:
+            transport (asyncio.Transport): Transport for the connection
+        """
+        self.transport = transport
+        self.client_address = transport.get_extra_info('peername')
+        self.server.connections.add(self)
+        logger.info("Connection established with %s", self.client_address)
+    
+    def get_buffer(self, sizehint):
+        """
+        Return the free part of the receive buffer.
+        
+        Args:
+            sizehint (int): Suggested buffer size (ignored)
+            
+        Returns:
+            memoryview: Buffer to receive into
+        """
+        return self.recv_view[self.tail:]
+    
+    def buffer_updated(self, nbytes):
+        """
+        Handle newly received bytes: the handshake first, packets afterwards.
+        
+        Args:
+            nbytes (int): Number of bytes written into the buffer
+        """
+        tail = self.tail + nbytes
+        
+        # The first message is the fixed-length initial string from the client
+        if self.state is None:
+            if tail < len(HANDSHAKE):
+                self.tail = tail
+                return
+            
+            initial_data = bytes(self.recv_buffer[:len(HANDSHAKE)])
+            if initial_data != HANDSHAKE:
+                logger.error("Invalid initial message from %s: %s", self.client_address, initial_data)
+                self.transport.close()
+                return
+            
+            logger.info("Received initial message: %s", initial_data)
+            
+            # Send connection setup success message
+            self.transport.write(HANDSHAKE_REPLY)
+            self.state = ClientState()
+            self.tail = 0
+            return
+        
+        # Process every complete packet in the buffer
+        try:
+            end = tail - tail % _PACKET.size
+            self.state.process_packets(self.recv_view[:end])
+            
+            # Move a partially received packet to the front of the buffer
+            self.recv_buffer[:tail - end] = self.recv_buffer[end:tail]
+            tail -= end
+            
+            # Send one cumulative ACK for the whole batch
+            ack_num = self.state.next_expected_seq
+            if ack_num != self.last_ack_num:
+                self.transport.write(_ACK.pack(ack_num))
+                self.last_ack_num = ack_num
+            
+        except Exception as e:
+            logger.error("Error processing data: %s", e)
+        finally:
+            self.tail = tail
+    
+    def connection_lost(self, exc):
+        """
+        Merge the connection's statistics into the server and queue them to be saved.
+        
+        Args:
+            exc (Exception): Error that closed the connection, or None on EOF
+        """
+        if exc is not None:
+            logger.error("Error handling client: %s", exc)
+        self.server.connections.discard(self)
+        
+        try:
+            if self.state is not None:
+                # Merge this connection's statistics and calculate the final statistics
+                self.server.merge_client_state(self.state)
+                self.server.calculate_final_statistics()
+                
+                # Save statistics to file on the writer thread, so the other
+                # connections keep being served while the files are written
+                snapshot = self.server.snapshot_statistics()
+                self.server.stats_writer.submit(self.server.save_statistics, self.client_address, snapshot)
+        except Exception as e:
+            logger.error("Error merging statistics: %s", e)
+        finally:
+            logger.info("Connection closed with %s", self.client_address)
+            
+            # Automatic collection is disabled while serving (see TCPServer.serve)
+            gc.collect()
+
 class TCPServer:
     """
     TCP Server implementing sliding window protocol.
     """
     
-    def __init__(self, host='0.0.0.0', port=12345, max_seq_num=2**16):
+    def __init__(self, host='0.0.0.0', port=12345, max_seq_num=2**16,
+                 stats_file='output/server_stats.json'):
         """
         Initialize the TCP server.
         
@@ -38,170 +384,130 @@ class TCPServer:
             host (str): Host address to bind the server
             port (int): Port number to bind the server
             max_seq_num (int): Maximum sequence number
+            stats_file (str): Path of the JSON file statistics are saved to
         """
         self.host = host
         self.port = port
         self.max_seq_num = max_seq_num
+        self.stats_file = stats_file
         self.server_socket = None
         
-        # Data structures for tracking packets
-        self.received_packets = set()
-        self.missing_packets = set()
+        # Totals over every closed connection (see ClientState)
+        self.received_count = 0  # Number of distinct sequence numbers received
+        self.missing_count = 0
         self.highest_seq_num = -1
         self.total_packets_received = 0
         self.total_packets_expected = 0
         
         # Statistics for visualization
-        self.window_sizes = []
-        self.window_timestamps = []
-        self.seq_nums_received = []
-        self.seq_nums_timestamps = []
-        self.seq_nums_dropped = []
-        self.goodput_measurements = []
-        self.goodput_timestamps = []
+        self.window_sizes = array('H')
+        self.window_timestamps = array('d')
+        self.seq_nums_received = array('I')
+        self.seq_nums_timestamps = array('d')
+        self.seq_nums_dropped = array('I')
+        self.goodput_measurements = array('d')
+        self.goodput_timestamps = array('d')
         
         # Thread synchronization
         self.lock = threading.Lock()
         
+        # Open connections, closed when the server stops so their statistics are saved
+        self.connections = set()
+        
+        # Statistics files are written by one background thread, in the order
+        # connections close (see ClientProtocol.connection_lost)
+        self.stats_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='TCP-Server-stats')
+        
         # Create output directory if it doesn't exist
         os.makedirs('output', exist_ok=True)
     
     def start(self):
         """
         Start the TCP server and listen for connections.
+        
+        Every connection is served by one asyncio event loop on the calling
+        thread, using uvloop's loop when it is installed.
         """
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            
-            logger.info(f"Server started on {self.host}:{self.port}")
-            
-            while True:
-                client_socket, client_address = self.server_socket.accept()
-                logger.info(f"Connection established with {client_address}")
-                
-                # Start a new thread to handle the client
-                client_thread = threading.Thread(
-                    target=self.handle_client,
-                    args=(client_socket, client_address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
-                
+            run_event_loop(self.serve())
         except KeyboardInterrupt:
             logger.info("Server shutting down...")
         except Exception as e:
             logger.error(f"Error: {e}")
         finally:
-            self.server_socket.close()
+            if self.server_socket:
+                self.server_socket.close()
+            
+            # Finish writing the statistics of every closed connection
+            self.stats_writer.shutdown(wait=True)
+            gc.enable()
     
-    def handle_client(self, client_socket, client_address):
+    async def serve(self):
         """
-        Handle client connection and implement the sliding window protocol.
-        
-        Args:
-            client_socket (socket): Socket object for client connection
-            client_address (tuple): Client address information (ip, port)
+        Accept connections until the server is stopped.
         """
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        
+        # Accepted sockets inherit the listening socket's buffer sizes
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        self.server_socket.bind((self.host, self.port))
+        
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: ClientProtocol(self), sock=self.server_socket)
+        
+        # Stop serving on SIGTERM as on SIGINT, so queued statistics still get
+        # written (signal handlers can only be installed on the main thread)
+        stop = asyncio.Event()
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, stop.set)
+        
+        logger.info(f"Server started on {self.host}:{self.port}")
+        
+        # Move everything allocated so far out of the collector's view and stop
+        # automatic collections while serving; each connection collects once
+        # when it closes, so cyclic garbage stays bounded
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+        
         try:
-            # First, receive the initial string from client
-            initial_data = client_socket.recv(4096)
-            if not initial_data:
-                logger.error("No initial data received from client")
-                return
-                
-            initial_message = initial_data.decode()
-            logger.info(f"Received initial message: {initial_message}")
-            
-            # Send connection setup success message
-            client_socket.send("Connection setup success".encode())
-            
-            # Start time for statistics
-            start_time = time.time()
-            last_measurement_time = start_time
-            
-            while True:
-                # Receive data from client
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-                
-                # Parse received data
-                try:
-                    message = json.loads(data.decode())
-                    seq_num = message.get('seq_num')
-                    window_size = message.get('window_size', 0)
-                    
-                    # Process the sequence number
-                    with self.lock:
-                        self.process_sequence_number(seq_num)
-                        
-                        # Track window size for visualization
-                        current_time = time.time() - start_time
-                        self.window_sizes.append(window_size)
-                        self.window_timestamps.append(current_time)
-                        
-                        # Calculate and record goodput periodically (every 1000 packets)
-                        if self.total_packets_received % 1000 == 0 and self.total_packets_received > 0:
-                            goodput = len(self.received_packets) / self.total_packets_expected
-                            self.goodput_measurements.append(goodput)
-                            self.goodput_timestamps.append(current_time)
-                            logger.info(f"Goodput: {goodput:.4f} ({len(self.received_packets)}/{self.total_packets_expected})")
-                    
-                    # Send ACK back to client
-                    ack_message = json.dumps({'ack': seq_num})
-                    client_socket.send(ack_message.encode())
-                    
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON data received")
-                except Exception as e:
-                    logger.error(f"Error processing data: {e}")
-            
-            # Calculate final statistics
-            self.calculate_final_statistics()
-            
-            # Save statistics to file
-            self.save_statistics(client_address)
-            
-        except Exception as e:
-            logger.error(f"Error handling client: {e}")
+            await stop.wait()
+            logger.info("Server shutting down...")
         finally:
-            client_socket.close()
-            logger.info(f"Connection closed with {client_address}")
+            server.close()
+        
+        # Close the open connections and let their connection_lost() callbacks
+        # queue the statistics before the loop stops
+        for protocol in list(self.connections):
+            protocol.transport.abort()
+        await asyncio.sleep(0)
     
-    def process_sequence_number(self, seq_num):
+    def merge_client_state(self, state):
         """
-        Process received sequence number and track missing packets.
+        Add a closed connection's statistics to the server totals.
         
         Args:
-            seq_num (int): Received sequence number
+            state (ClientState): State of the closed connection
         """
-        if seq_num is None:
-            return
-        
-        # Record sequence number and timestamp
-        current_time = time.time()
-        self.seq_nums_received.append(seq_num)
-        self.seq_nums_timestamps.append(current_time)
-        
-        # Add to received packets set
-        self.received_packets.add(seq_num)
-        self.total_packets_received += 1
-        
-        # Update highest sequence number
-        if seq_num > self.highest_seq_num:
-            # Update expected packets count
-            self.total_packets_expected = seq_num + 1
-            
-            # Check for missing packets
-            for i in range(self.highest_seq_num + 1, seq_num):
-                if i not in self.received_packets:
-                    self.missing_packets.add(i)
-                    self.seq_nums_dropped.append(i)
+        with self.lock:
+            self.received_count += state.received_count
+            self.missing_count += state.missing_count
+            self.highest_seq_num = max(self.highest_seq_num, state.highest_seq_num)
+            self.total_packets_received += state.total_packets_received
+            self.total_packets_expected += state.total_packets_expected
             
-            self.highest_seq_num = seq_num
+            self.window_sizes.extend(state.window_sizes)
+            self.window_timestamps.extend(state.window_timestamps)
+            self.seq_nums_received.extend(state.seq_nums_received)
+            self.seq_nums_timestamps.extend(state.seq_nums_timestamps)
+            self.seq_nums_dropped.extend(state.seq_nums_dropped)
+            self.goodput_measurements.extend(state.goodput_measurements)
+            self.goodput_timestamps.extend(state.goodput_timestamps)
     
     def calculate_final_statistics(self):
         """
@@ -211,13 +517,13 @@ class TCPServer:
             return
         
         # Calculate final goodput
-        final_goodput = len(self.received_packets) / self.total_packets_expected
-        logger.info(f"Final goodput: {final_goodput:.4f} ({len(self.received_packets)}/{self.total_packets_expected})")
+        final_goodput = self.received_count / self.total_packets_expected
+        logger.info("Final goodput: %.4f (%d/%d)", final_goodput, self.received_count, self.total_packets_expected)
         
         # Calculate average goodput
         if self.goodput_measurements:
             avg_goodput = sum(self.goodput_measurements) / len(self.goodput_measurements)
-            logger.info(f"Average goodput: {avg_goodput:.4f}")
+            logger.info("Average goodput: %.4f", avg_goodput)
     
     def get_statistics(self):
         """
@@ -226,12 +532,34 @@ class TCPServer:
         Returns:
             dict: Server statistics
         """
+        stats = self.get_scalar_statistics()
+        for name, values in self.get_telemetry_arrays().items():
+            stats[name] = values.tolist()
+        return stats
+    
+    def get_scalar_statistics(self):
+        """
+        Get the server's counters.
+        
+        Returns:
+            dict: Scalar server statistics
+        """
         return {
-            'received_packets': len(self.received_packets),
-            'missing_packets': len(self.missing_packets),
+            'received_packets': self.received_count,
+            'missing_packets': self.missing_count,
             'total_packets_received': self.total_packets_received,
             'total_packets_expected': self.total_packets_expected,
-            'highest_seq_num': self.highest_seq_num,
+            'highest_seq_num': self.highest_seq_num
+        }
+    
+    def get_telemetry_arrays(self):
+        """
+        Get the server's telemetry for visualization.
+        
+        Returns:
+            dict: Telemetry arrays by statistic name
+        """
+        return {
             'window_sizes': self.window_sizes,
             'window_timestamps': self.window_timestamps,
             'seq_nums_received': self.seq_nums_received,
@@ -241,28 +569,154 @@ class TCPServer:
             'goodput_timestamps': self.goodput_timestamps
         }
     
-    def save_statistics(self, client_address):
+    def snapshot_statistics(self):
         """
-        Save server statistics to file.
+        Copy the server's counters and telemetry, so they can be saved while
+        later connections keep adding to them.
+        
+        Returns:
+            tuple: (scalar statistics, telemetry arrays by statistic name)
+        """
+        with self.lock:
+            arrays = {name: values[:] for name, values in self.get_telemetry_arrays().items()}
+            return self.get_scalar_statistics(), arrays
+    
+    def save_statistics(self, client_address, snapshot):
+        """
+        Save a snapshot of the server statistics to file.
+        
+        The counters are saved as JSON to stats_file. With numpy installed, the
+        telemetry arrays are saved in binary to .npy files next to it (see
+        stats_json.save_arrays); otherwise they are included in the JSON file.
         
         Args:
             client_address (tuple): Client address information (ip, port)
+            snapshot (tuple): Statistics returned by snapshot_statistics()
         """
-        stats = self.get_statistics()
+        stats, arrays = snapshot
         stats['client_address'] = client_address
         stats['server_address'] = (self.host, self.port)
         
-        with open('output/server_stats.json', 'w') as f:
-            json.dump(stats, f, indent=4)
+        try:
+            try:
+                arrays_path = save_arrays(arrays, self.stats_file)
+            except ImportError:
+                # numpy is not installed
+                for name, values in arrays.items():
+                    stats[name] = values.tolist()
+            else:
+                logger.info("Server telemetry saved to %s", arrays_path)
+            
+            save_json(stats, self.stats_file)
+        except Exception as e:
+            logger.error("Error saving statistics: %s", e)
+            return
+        
+        logger.info("Server statistics saved to %s", self.stats_file)
+    
+    def merge_saved_statistics(self, stats_files):
+        """
+        Add statistics saved by other server processes to this server's and save the result.
+        
+        Each merged file (and the arrays next to it) is removed, so stats_file
+        is left as the only statistics of the run. A file that does not exist
+        belongs to a process that served no connections and is skipped.
+        
+        Args:
+            stats_files (list): Paths of the JSON files saved by the other processes
+        """
+        client_address = None
+        for stats_file in stats_files:
+            if not os.path.exists(stats_file):
+                continue
+            
+            stats = load_json(stats_file)
+            telemetry_names = self.get_telemetry_arrays()
+            if all(name in stats for name in telemetry_names):
+                arrays = {name: stats[name] for name in telemetry_names}
+            else:
+                arrays = {name: values.tolist() for name, values in load_arrays(stats_file, mmap_mode=None).items()}
+                remove_arrays(stats_file)
+            
+            with self.lock:
+                self.received_count += stats['received_packets']
+                self.missing_count += stats['missing_packets']
+                self.highest_seq_num = max(self.highest_seq_num, stats['highest_seq_num'])
+                self.total_packets_received += stats['total_packets_received']
+                self.total_packets_expected += stats['total_packets_expected']
+                
+                for name, values in self.get_telemetry_arrays().items():
+                    values.extend(arrays[name])
+            
+            client_address = stats['client_address']
+            os.remove(stats_file)
+        
+        if client_address is not None:
+            self.save_statistics(client_address, self.snapshot_statistics())
+
+def run_worker(host, port, stats_file):
+    """
+    Run one server worker process until it is stopped.
+    
+    Args:
+        host (str): Host address to bind the server
+        port (int): Port number to bind the server
+        stats_file (str): Path of the JSON file statistics are saved to
         
-        logger.info("Server statistics saved to output/server_stats.json")
+    Returns:
+        TCPServer: The stopped server
+    """
+    server = TCPServer(host=host, port=port, stats_file=stats_file)
+    server.start()
+    return server
 
 def main():
     """
     Main function to start the TCP server.
     """
-    server = TCPServer()
-    server.start()
+    import argparse
+    
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='TCP Sliding Window Protocol Server')
+    parser.add_argument('--host', default='0.0.0.0', help='Host address to bind to')
+    parser.add_argument('--port', type=int, default=12345, help='Port number to bind to')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of server processes sharing the port (0 = one per CPU)')
+    
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+    
+    # Every worker binds the port with SO_REUSEPORT and the kernel spreads connections
+    # across them; the extra workers are spawned rather than forked so each one starts
+    # its own logging thread, and each saves statistics to its own file
+    context = multiprocessing.get_context('spawn')
+    processes = []
+    worker_stats_files = []
+    for worker in range(1, workers):
+        stats_file = f'output/server_stats_worker{worker}.json'
+        process = context.Process(target=run_worker, args=(args.host, args.port, stats_file), daemon=True)
+        process.start()
+        processes.append(process)
+        worker_stats_files.append(stats_file)
+    
+    try:
+        server = run_worker(args.host, args.port, 'output/server_stats.json')
+    finally:
+        # Pass the stop on to the other workers: terminate() sends SIGTERM, which
+        # they handle like this one by saving their statistics before exiting.
+        # A worker that does not finish in time is killed as a last resort
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                logger.warning("Killing worker process %d, which did not stop in time", process.pid)
+                process.kill()
+                process.join()
+    
+    # Combine every worker's statistics into output/server_stats.json
+    if worker_stats_files:
+        server.merge_saved_statistics(worker_stats_files)
 
 if __name__ == "__main__":
     main()
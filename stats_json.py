@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+TCP Sliding Window Protocol - Statistics File Module
+CS 258 Project Assignment
+
+Author: Xiangyi Li (xiangyi@benchflow.ai)
+
+This module reads and writes the statistics files shared by the server and
+the visualizer: JSON files, written with orjson when it is installed, and the
+telemetry arrays saved next to them as .npy files.
+"""
+
+import os
+import glob
+import json
+import shutil
+
+# orjson is optional: statistics files are read and written with the json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json(path):
+    """
+    Load a JSON statistics file.
+    
+    Args:
+        path (str): Path to the JSON file
+    
+    Returns:
+        dict: The decoded statistics
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _to_list(value):
+    """
+    Convert a value the JSON encoder cannot handle itself (NumPy values without
+    orjson, array.array values) to a list or Python number.
+    
+    Args:
+        value: NumPy array or scalar, or array.array
+        
+    Returns:
+        list: The value as Python objects
+    """
+    return value.tolist()
+
+def save_json(data, path):
+    """
+    Save statistics to a JSON file.
+    
+    orjson indents the file in C at almost no cost. The json module fallback
+    writes compact JSON, since indentation forces it onto its pure-Python
+    encoder.
+    
+    Args:
+        data (dict): Statistics to save (NumPy values, arrays and integer keys are allowed)
+        path (str): Path to the JSON file
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=_to_list, option=option))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f, default=_to_list)
+
+def arrays_dir(path):
+    """
+    Get the directory holding the arrays saved with a JSON statistics file.
+    
+    Args:
+        path (str): Path to the JSON file
+        
+    Returns:
+        str: Path of the directory next to the JSON file
+    """
+    return os.path.splitext(path)[0] + '_arrays'
+
+def save_arrays(arrays, path):
+    """
+    Save arrays to one uncompressed .npy file each, next to a JSON statistics file.
+    
+    Uncompressed .npy files can be memory-mapped by load_arrays(), unlike the
+    members of a .npz archive. Arrays saved earlier for the same file are removed.
+    
+    Args:
+        arrays (dict): NumPy arrays (or array.array values) by statistic name
+        path (str): Path to the JSON file
+        
+    Returns:
+        str: Directory the arrays were saved to
+    """
+    import numpy as np
+    
+    directory = arrays_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    for old_file in glob.glob(os.path.join(directory, '*.npy')):
+        os.remove(old_file)
+    for name, values in arrays.items():
+        np.save(os.path.join(directory, name + '.npy'), np.asarray(values))
+    return directory
+
+def load_arrays(path, mmap_mode='r'):
+    """
+    Load the arrays saved next to a JSON statistics file.
+    
+    The arrays are memory-mapped by default, so their data is only read from
+    disk as it is used.
+    
+    Args:
+        path (str): Path to the JSON file
+        mmap_mode (str): np.load memory-map mode, or None to read the arrays into memory
+        
+    Returns:
+        dict: NumPy arrays by statistic name (empty when none were saved)
+    """
+    import numpy as np
+    
+    arrays = {}
+    for array_file in sorted(glob.glob(os.path.join(arrays_dir(path), '*.npy'))):
+        name = os.path.splitext(os.path.basename(array_file))[0]
+        arrays[name] = np.load(array_file, mmap_mode=mmap_mode)
+    return arrays
+
+def remove_arrays(path):
+    """
+    Remove the arrays saved next to a JSON statistics file, if there are any.
+    
+    Args:
+        path (str): Path to the JSON file
+    """
+    shutil.rmtree(arrays_dir(path), ignore_errors=True)
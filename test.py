@@ -18,6 +18,7 @@ import time
 import json
 import subprocess
 import signal
+import socket
 import logging
 from pathlib import Path
 
@@ -28,6 +29,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger('TCP-Test')
 
+# Harness run with `python -c`: imports the server module, starts a server and
+# saves its statistics when the process exits (SIGTERM included)
+SERVER_HARNESS = """
+import atexit, json, signal, sys
+import server
+
+instance = server.TCPServer()
+
+def save_statistics():
+    with open({stats_file!r}, 'w') as f:
+        json.dump(instance.get_statistics(), f, indent=4)
+    print("Server statistics saved to " + {stats_file!r})
+
+atexit.register(save_statistics)
+signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
+instance.start()
+"""
+
+# Harness run with `python -c`: imports the client module, sends total_packets
+# packets and saves the client's statistics when the process exits
+CLIENT_HARNESS = """
+import atexit, json, signal, sys
+import client
+
+instance = client.TCPClient(total_packets={total_packets})
+
+def save_statistics():
+    with open({stats_file!r}, 'w') as f:
+        json.dump(instance.get_statistics(), f, indent=4)
+    print("Client statistics saved to " + {stats_file!r})
+
+atexit.register(save_statistics)
+signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
+instance.start()
+"""
+
 class TCPTester:
     """
     Test class for TCP sliding window protocol implementation.
@@ -61,13 +98,10 @@ class TCPTester:
             bool: True if server started successfully, False otherwise
         """
         try:
-            # Create a modified version of server.py that saves statistics
-            self.create_test_server_script()
-            
             # Start the server process
             logger.info("Starting server...")
             self.server_process = subprocess.Popen(
-                [sys.executable, os.path.join(self.output_dir, 'test_server.py')],
+                [sys.executable, '-c', SERVER_HARNESS.format(stats_file=self.server_stats_file)],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
@@ -100,16 +134,12 @@ class TCPTester:
             bool: True if client started successfully, False otherwise
         """
         try:
-            # Create a modified version of client.py that saves statistics
-            self.create_test_client_script()
-            
             # Start the client process
             logger.info(f"Starting client with {total_packets} packets...")
             self.client_process = subprocess.Popen(
                 [
-                    sys.executable, 
-                    os.path.join(self.output_dir, 'test_client.py'),
-                    '--packets', str(total_packets)
+                    sys.executable,
+                    '-c', CLIENT_HARNESS.format(total_packets=total_packets, stats_file=self.client_stats_file)
                 ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -119,8 +149,8 @@ class TCPTester:
             # Wait for client to start
             time.sleep(2)
             
-            if self.client_process.poll() is not None:
-                # Client process exited
+            if self.client_process.poll() not in (None, 0):
+                # Client process exited with an error (a fast run may already be done)
                 stdout, stderr = self.client_process.communicate()
                 logger.error(f"Client failed to start: {stderr}")
                 return False
@@ -132,145 +162,6 @@ class TCPTester:
             logger.error(f"Error starting client: {e}")
             return False
     
-    def create_test_server_script(self):
-        """
-        Create a modified version of server.py that saves statistics.
-        """
-        # Read the original server.py
-        with open('server.py', 'r') as f:
-            server_code = f.read()
-        
-        # Add code to save statistics
-        save_stats_code = f"""
-# Save statistics to file
-def save_statistics(server):
-    stats = server.get_statistics()
-    with open('{self.server_stats_file}', 'w') as f:
-        json.dump(stats, f, indent=4)
-    print(f"Server statistics saved to {self.server_stats_file}")
-
-# Modify main function to save statistics
-def main():
-    # Create and start the server
-    server = TCPServer()
-    
-    # Register signal handler to save statistics on exit
-    def signal_handler(sig, frame):
-        print("Saving statistics before exit...")
-        save_statistics(server)
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    try:
-        server.start()
-    except KeyboardInterrupt:
-        save_statistics(server)
-    finally:
-        save_statistics(server)
-
-if __name__ == "__main__":
-    main()
-"""
-        
-        # Replace the original main function
-        modified_server_code = server_code.replace(
-            "def main():\n    \"\"\"\n    Main function to start the TCP server.\n    \"\"\"\n    # Create and start the server\n    server = TCPServer()\n    server.start()\n\nif __name__ == \"__main__\":\n    main()",
-            save_stats_code
-        )
-        
-        # Add import for signal module
-        if "import signal" not in modified_server_code:
-            modified_server_code = modified_server_code.replace(
-                "import logging",
-                "import logging\nimport signal"
-            )
-        
-        # Write the modified server code to a new file
-        with open(os.path.join(self.output_dir, 'test_server.py'), 'w') as f:
-            f.write(modified_server_code)
-    
-    def create_test_client_script(self):
-        """
-        Create a modified version of client.py that saves statistics.
-        """
-        # Read the original client.py
-        with open('client.py', 'r') as f:
-            client_code = f.read()
-        
-        # Add code to save statistics
-        save_stats_code = f"""
-# Save statistics to file
-def save_statistics(client):
-    stats = client.get_statistics()
-    with open('{self.client_stats_file}', 'w') as f:
-        json.dump(stats, f, indent=4)
-    print(f"Client statistics saved to {self.client_stats_file}")
-
-# Modify main function to save statistics
-def main():
-    import argparse
-    
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='TCP Sliding Window Protocol Client')
-    parser.add_argument('--host', default='localhost', help='Server hostname or IP address')
-    parser.add_argument('--port', type=int, default=12345, help='Server port number')
-    parser.add_argument('--window', type=int, default=10, help='Initial window size')
-    parser.add_argument('--drop', type=float, default=0.01, help='Packet drop probability')
-    parser.add_argument('--retransmit', type=int, default=100, 
-                        help='Retransmit after this many sequence numbers')
-    parser.add_argument('--packets', type=int, default=10000000, help='Total packets to send')
-    
-    args = parser.parse_args()
-    
-    # Create and start the client
-    client = TCPClient(
-        server_host=args.host,
-        server_port=args.port,
-        window_size=args.window,
-        drop_probability=args.drop,
-        retransmit_after=args.retransmit,
-        total_packets=args.packets
-    )
-    
-    # Register signal handler to save statistics on exit
-    def signal_handler(sig, frame):
-        print("Saving statistics before exit...")
-        save_statistics(client)
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    try:
-        client.start()
-    except KeyboardInterrupt:
-        save_statistics(client)
-    finally:
-        save_statistics(client)
-
-if __name__ == "__main__":
-    main()
-"""
-        
-        # Replace the original main function
-        modified_client_code = client_code.replace(
-            "def main():\n    \"\"\"\n    Main function to start the TCP client.\n    \"\"\"\n    import argparse\n    \n    # Parse command line arguments\n    parser = argparse.ArgumentParser(description='TCP Sliding Window Protocol Client')\n    parser.add_argument('--host', default='localhost', help='Server hostname or IP address')\n    parser.add_argument('--port', type=int, default=12345, help='Server port number')\n    parser.add_argument('--window', type=int, default=10, help='Initial window size')\n    parser.add_argument('--drop', type=float, default=0.01, help='Packet drop probability')\n    parser.add_argument('--retransmit', type=int, default=100, \n                        help='Retransmit after this many sequence numbers')\n    parser.add_argument('--packets', type=int, default=10000000, help='Total packets to send')\n    \n    args = parser.parse_args()\n    \n    # Create and start the client\n    client = TCPClient(\n        server_host=args.host,\n        server_port=args.port,\n        window_size=args.window,\n        drop_probability=args.drop,\n        retransmit_after=args.retransmit,\n        total_packets=args.packets\n    )\n    \n    client.start()\n\nif __name__ == \"__main__\":\n    main()",
-            save_stats_code
-        )
-        
-        # Add import for signal module
-        if "import signal" not in modified_client_code:
-            modified_client_code = modified_client_code.replace(
-                "import logging",
-                "import logging\nimport signal"
-            )
-        
-        # Write the modified client code to a new file
-        with open(os.path.join(self.output_dir, 'test_client.py'), 'w') as f:
-            f.write(modified_client_code)
-    
     def run_test(self, total_packets=10000, timeout=300):
         """
         Run a complete test of the TCP sliding window protocol.
@@ -359,6 +250,59 @@ if __name__ == "__main__":
                 self.client_process.kill()
             self.client_process = None
     
+    def retransmission_lag(self, retransmit_after, window_size=100):
+        """
+        Measure after how many packets the client retransmits a dropped packet.
+        
+        The client sends into a socket pair with no server, so the window stays
+        full behind the dropped packet (sequence number 0).
+        
+        Args:
+            retransmit_after (int): Client retransmission setting to measure
+            window_size (int): Client window size
+            
+        Returns:
+            int: Number of packets sent before the retransmission of packet 0
+        """
+        import client
+        
+        tcp_client = client.TCPClient(window_size=window_size, drop_probability=0,
+                                      retransmit_after=retransmit_after, total_packets=10 * window_size)
+        tcp_client.client_socket, peer = socket.socketpair()
+        try:
+            # Drop packet 0 the way send_window() does, then fill the rest of the window
+            tcp_client.schedule_retransmission(0, retransmit_after)
+            tcp_client.send_packet(0, window_size, True)
+            tcp_client.next_seq_num = 1
+            tcp_client.send_window()
+            tcp_client.handle_retransmissions()
+            tcp_client.flush_packets()
+            
+            seq_nums = [seq_num for seq_num, _ in client._PACKET.iter_unpack(peer.recv(65536))]
+            return seq_nums.index(0)
+        finally:
+            tcp_client.client_socket.close()
+            peer.close()
+    
+    def test_retransmission_delay(self):
+        """
+        Check that a larger retransmission setting delays the retransmission.
+        
+        A packet due before the window fills is retransmitted as soon as its
+        deadline is reached; a later deadline waits until the window is full.
+        
+        Returns:
+            bool: True if the retransmission lags grow with the setting, False otherwise
+        """
+        lags = [self.retransmission_lag(retransmit_after) for retransmit_after in (3, 50, 1000)]
+        logger.info(f"Retransmission lags for --retransmit 3, 50, 1000: {lags}")
+        
+        if lags != [2, 49, 99]:
+            logger.error("Retransmission lag does not follow the --retransmit setting")
+            return False
+        
+        return True
+    
     def generate_visualizations(self):
         """
         Generate visualizations using the visualizer module.
@@ -425,7 +369,7 @@ def main():
     tester = TCPTester(output_dir=args.output)
     
     # Run test
-    if tester.run_test(total_packets=args.packets, timeout=args.timeout):
+    if tester.test_retransmission_delay() and tester.run_test(total_packets=args.packets, timeout=args.timeout):
         # Generate visualizations
         tester.generate_visualizations()
         
@@ -11,21 +11,53 @@ This simplified test script:
 """
 
 import os
-import json
-import random
-import time
+import functools
 import numpy as np
-import subprocess
-import sys
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# The visualizer module (and with it matplotlib) is imported where it is used,
+# and logging is configured in main(), so importing this module stays cheap
 logger = logging.getLogger('TCP-Test-Simplified')
 
+def clamped_walk(deltas, start, low, high):
+    """
+    Apply each delta in turn to a running value kept within [low, high].
+    
+    Args:
+        deltas (np.ndarray): Changes to apply
+        start (int): Initial value
+        low (int): Lowest allowed value
+        high (int): Highest allowed value
+        
+    Returns:
+        np.ndarray: The value after each delta
+    """
+    values = np.empty(len(deltas), dtype=np.int64)
+    current = start
+    for i in range(len(deltas)):
+        current = max(low, min(high, current + deltas[i]))
+        values[i] = current
+    return values
+
+@functools.lru_cache(maxsize=None)
+def get_clamped_walk():
+    """
+    Get the clamped_walk implementation, compiled by numba on first use.
+    
+    numba is optional: the window size walk runs as a plain Python loop
+    without it. It is imported here rather than with the module, so only
+    generating data pays for its startup.
+    
+    Returns:
+        function: clamped_walk, compiled when numba is installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return clamped_walk
+    
+    return numba.njit(cache=True)(clamped_walk)
+
 class MockDataGenerator:
     """
     Generate mock data for testing visualization
@@ -55,31 +87,26 @@ class MockDataGenerator:
         Returns:
             dict: Client statistics
         """
-        # Initialize statistics
-        window_sizes = []
-        window_timestamps = []
-        retransmission_counts = {}
-        
-        # Generate window size data
-        current_window = 10
-        for i in range(total_packets):
-            # Randomly adjust window size
-            if random.random() < 0.1:
-                current_window = max(5, min(100, current_window + random.randint(-3, 5)))
-            
-            window_sizes.append(current_window)
-            window_timestamps.append(i * 0.01)  # Simulate time passing
+        rng = np.random.default_rng()
+        
+        # Generate window size data: 10% of the packets adjust the window by -3..5,
+        # keeping it within [5, 100]; only those packets go through the walk, and
+        # every packet then takes the window of the latest adjustment
+        adjusted = rng.random(total_packets) < 0.1
+        deltas = rng.integers(-3, 6, size=np.count_nonzero(adjusted))
+        windows = np.concatenate(([10], get_clamped_walk()(deltas, 10, 5, 100)))
+        window_sizes = windows.astype(np.int16)[np.cumsum(adjusted)]
+        window_timestamps = np.arange(total_packets) * 0.01  # Simulate time passing
         
         # Generate retransmission data
         total_dropped = int(total_packets * 0.01)  # 1% drop rate
         total_retransmitted = total_dropped
         
-        # Create retransmission counts
-        for i in range(1, 5):  # 1 to 4 retransmissions
-            count = int(total_dropped * (0.7 ** (i-1)))  # Decreasing probability
-            for j in range(count):
-                seq_num = random.randint(0, total_packets-1)
-                retransmission_counts[str(seq_num)] = i
+        # Create retransmission counts: distinct packets retransmitted 1 to 4 times,
+        # with decreasing probability
+        packets_per_count = [int(total_dropped * (0.7 ** (i-1))) for i in range(1, 5)]
+        retransmission_attempt_counts = np.repeat(np.arange(1, 5, dtype=np.uint8), packets_per_count)
+        retransmission_seq_nums = rng.choice(total_packets, size=retransmission_attempt_counts.size, replace=False).astype(np.int32)
         
         # Create client statistics
         client_stats = {
@@ -91,12 +118,13 @@ class MockDataGenerator:
             'total_acked': total_packets - total_dropped + total_retransmitted,
             'window_sizes': window_sizes,
             'window_timestamps': window_timestamps,
-            'retransmission_counts': retransmission_counts
+            'retransmission_seq_nums': retransmission_seq_nums,
+            'retransmission_attempt_counts': retransmission_attempt_counts
         }
         
         # Save to file
-        with open(self.client_stats_file, 'w') as f:
-            json.dump(client_stats, f, indent=4)
+        from visualizer import save_statistics
+        save_statistics(client_stats, self.client_stats_file)
         
         logger.info(f"Mock client statistics saved to {self.client_stats_file}")
         return client_stats
@@ -111,37 +139,31 @@ class MockDataGenerator:
         Returns:
             dict: Server statistics
         """
-        # Initialize statistics
-        goodput_measurements = []
-        measurement_timestamps = []
-        seq_nums_received = []
-        seq_nums_dropped = []
-        seq_timestamps = []
-        
-        # Generate goodput data
-        for i in range(0, total_packets, 100):
-            # Calculate goodput (slightly decreasing over time)
-            goodput = 0.99 - (i / total_packets) * 0.05 + random.uniform(-0.01, 0.01)
-            goodput_measurements.append(goodput)
-            measurement_timestamps.append(i * 0.01)
+        rng = np.random.default_rng()
+        
+        # Generate goodput data every 100 packets (slightly decreasing over time)
+        measured = np.arange(0, total_packets, 100)
+        goodput = 0.99 - (measured / total_packets) * 0.05 + rng.uniform(-0.01, 0.01, size=measured.size)
+        goodput_measurements = goodput.astype(np.float32)
+        measurement_timestamps = measured * 0.01
         
         # Generate sequence number data
-        for i in range(total_packets):
-            if random.random() < 0.99:  # 99% success rate
-                seq_nums_received.append(i)
-                seq_timestamps.append(i * 0.01)
-            else:
-                seq_nums_dropped.append(i)
+        all_seq_nums = np.arange(total_packets, dtype=np.int32)
+        received_mask = rng.random(total_packets) < 0.99  # 99% success rate
+        seq_nums_received = all_seq_nums[received_mask]
+        seq_nums_dropped = all_seq_nums[~received_mask]
+        seq_timestamps = seq_nums_received * 0.01
         
         # Create server statistics
         server_stats = {
             'server_address': '127.0.0.1:12345',
             'client_address': ('127.0.0.1', 54321),
             'total_packets_expected': total_packets,
-            'total_packets_received': len(seq_nums_received),
-            'missing_packets': len(seq_nums_dropped),
+            'total_packets_received': seq_nums_received.size,
+            'missing_packets': seq_nums_dropped.size,
             'goodput_measurements': goodput_measurements,
             'measurement_timestamps': measurement_timestamps,
+            'average_goodput': float(np.mean(goodput)),  # From the float64 series, before downcasting
             'window_sizes': [],  # Server doesn't track window sizes
             'window_timestamps': [],
             'seq_nums_received': seq_nums_received,
@@ -151,41 +173,33 @@ class MockDataGenerator:
         }
         
         # Save to file
-        with open(self.server_stats_file, 'w') as f:
-            json.dump(server_stats, f, indent=4)
+        from visualizer import save_statistics
+        save_statistics(server_stats, self.server_stats_file)
         
         logger.info(f"Mock server statistics saved to {self.server_stats_file}")
         return server_stats
     
-    def generate_visualizations(self):
+    def generate_visualizations(self, client_stats=None, server_stats=None):
         """
         Generate visualizations using the visualizer module
         
+        Args:
+            client_stats (dict): Client statistics already in memory, or None to load the saved file
+            server_stats (dict): Server statistics already in memory, or None to load the saved file
+            
         Returns:
             bool: True if visualizations generated successfully, False otherwise
         """
         try:
-            # Run the visualizer
+            # Run the visualizer in this process
             logger.info("Generating visualizations...")
-            visualizer_process = subprocess.run(
-                [
-                    sys.executable, 
-                    'visualizer.py',
-                    '--client', self.client_stats_file,
-                    '--server', self.server_stats_file,
-                    '--output', self.output_dir
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            from visualizer import TCPVisualizer
+            visualizer = TCPVisualizer(output_dir=self.output_dir, create_output_dir=False)
+            if client_stats is None or server_stats is None:
+                client_stats, server_stats = visualizer.load_data(self.client_stats_file, self.server_stats_file)
+            visualizer.generate_report(client_stats, server_stats)
             
-            if visualizer_process.returncode != 0:
-                logger.error(f"Visualizer failed: {visualizer_process.stderr}")
-                return False
-            
-            logger.info("Visualizations generated successfully")
-            logger.info(visualizer_process.stdout)
+            logger.info(f"Visualizations generated successfully in {self.output_dir}/")
             
             return True
             
@@ -199,6 +213,12 @@ def main():
     """
     import argparse
     
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='TCP Sliding Window Protocol Mock Data Generator')
     parser.add_argument('--packets', type=int, default=1000, 
@@ -212,11 +232,11 @@ def main():
     generator = MockDataGenerator(output_dir=args.output)
     
     # Generate mock data
-    generator.generate_client_stats(total_packets=args.packets)
-    generator.generate_server_stats(total_packets=args.packets)
+    client_stats = generator.generate_client_stats(total_packets=args.packets)
+    server_stats = generator.generate_server_stats(total_packets=args.packets)
     
-    # Generate visualizations
-    if generator.generate_visualizations():
+    # Generate visualizations from the statistics in memory
+    if generator.generate_visualizations(client_stats, server_stats):
         print("Mock data and visualizations generated successfully")
         print(f"Results saved to {args.output}/")
     else:
@@ -13,35 +13,214 @@ This visualization module:
 """
 
 import os
-import json
+import sys
+import csv
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+import matplotlib.style
+from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from stats_json import load_json, save_json, save_arrays, load_arrays
+
+# Resolution and PNG compression of the saved plots: a low zlib level
+# encodes much faster for a somewhat larger file
+PLOT_DPI = 120
+PNG_COMPRESS_LEVEL = 1
+
+# Parallel plot rendering (TCPVisualizer's parallel_plots option) needs fork and
+# more than one CPU: forked workers inherit the loaded matplotlib, whereas
+# spawned ones would spend longer importing it than a plot takes to render
+PARALLEL_PLOTS_SUPPORTED = sys.platform.startswith('linux') and (os.cpu_count() or 1) > 1
+
+# Visualizer and plot arguments of a plot worker process, set in each worker
+# by _init_plot_worker (never in the parent process)
+_worker_report = None
+
+# Settings shared by every plot, applied once on top of the ggplot style
+PLOT_RC_PARAMS = {
+    'figure.figsize': (12, 6),
+    'axes.grid': True,
+    'legend.frameon': True,
+    'savefig.dpi': PLOT_DPI,
+    'savefig.bbox': 'tight'
+}
+
+# Longest series drawn point by point; longer ones are downsampled first
+MAX_PLOT_POINTS = 4000
+
+# NumPy types of the statistics series, applied when statistics are loaded:
+# window sizes fit in 16 bits and sequence numbers in 32, while timestamps
+# keep double precision
+CLIENT_SERIES_DTYPES = {
+    'window_sizes': np.int16,
+    'window_timestamps': np.float64,
+    'retransmission_seq_nums': np.int32,
+    'retransmission_attempt_counts': np.uint8
+}
+SERVER_SERIES_DTYPES = {
+    'window_sizes': np.int16,
+    'window_timestamps': np.float64,
+    'seq_nums_received': np.int32,
+    'seq_nums_dropped': np.int32,
+    'seq_timestamps': np.float64,
+    'seq_nums_timestamps': np.float64,
+    'goodput_measurements': np.float32,
+    'measurement_timestamps': np.float64,
+    'goodput_timestamps': np.float64
+}
+
+def save_statistics(stats, path):
+    """
+    Save statistics, storing their NumPy arrays as .npy files next to the JSON file.
+    
+    The JSON file only receives the other values, so large series are never
+    expanded into Python numbers or JSON text, and load_statistics() can
+    memory-map them.
+    
+    Args:
+        stats (dict): Statistics to save
+        path (str): Path to the JSON file
+    """
+    arrays = {name: value for name, value in stats.items() if isinstance(value, np.ndarray)}
+    if arrays:
+        save_arrays(arrays, path)
+    save_json({name: value for name, value in stats.items() if name not in arrays}, path)
+
+def load_statistics(path):
+    """
+    Load statistics saved as a JSON file and, optionally, .npy files next to it.
+    
+    The .npy arrays are memory-mapped, so a large series is only read from
+    disk as it is used instead of being loaded whole.
+    
+    Args:
+        path (str): Path to the JSON file
+        
+    Returns:
+        dict: The statistics
+    """
+    stats = load_json(path)
+    
+    # Telemetry arrays may be saved separately next to the JSON file; series
+    # stored in the JSON file itself take precedence over them
+    for name, values in load_arrays(path).items():
+        if name not in stats:
+            stats[name] = values
+    
+    return stats
+
+def _as_series_arrays(stats, dtypes):
+    """
+    Convert the statistics series that are present to typed NumPy arrays, in place.
+    
+    Args:
+        stats (dict): Statistics loaded from a file
+        dtypes (dict): NumPy type by series name
+    """
+    for name, dtype in dtypes.items():
+        # Arrays loaded from .npy files keep the type they were saved with, so
+        # memory-mapped data is not copied into memory by a conversion
+        if name in stats and not isinstance(stats[name], np.ndarray):
+            stats[name] = np.asarray(stats[name], dtype=dtype)
+
+def _downsample(x, y, max_points=MAX_PLOT_POINTS):
+    """
+    Keep every n-th point of a series so that at most about max_points remain.
+    
+    Args:
+        x (sequence): X coordinates
+        y (sequence): Y coordinates
+        max_points (int): Number of points to keep
+        
+    Returns:
+        tuple: (x, y) NumPy arrays
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    step = max(1, len(x) // max_points)
+    return x[::step], y[::step]
 
 class TCPVisualizer:
     """
     Visualization class for TCP sliding window protocol statistics.
     """
     
-    def __init__(self, output_dir='./output'):
+    def __init__(self, output_dir='./output', create_output_dir=True, parallel_plots=False):
         """
         Initialize the TCP visualizer.
         
         Args:
             output_dir (str): Directory to save visualization outputs
+            create_output_dir (bool): Create output_dir if it doesn't exist (False
+                when the caller already has)
+            parallel_plots (bool): Render the report's plots in forked worker
+                processes, one per plot (see render_plots_in_workers)
         """
         self.output_dir = output_dir
+        self.parallel_plots = parallel_plots and PARALLEL_PLOTS_SUPPORTED
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        if create_output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
-        # Set plot style
-        plt.style.use('ggplot')
+        # Set plot style (figures read it when they are created and saved)
+        matplotlib.style.use(['ggplot', PLOT_RC_PARAMS])
         
         # Timestamp for file naming
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Figure and Axes shared by every plot, created on first use
+        self.figure = None
+        self.axes = None
+    
+    def new_plot(self):
+        """
+        Get the shared figure with its Axes cleared for a new plot.
+        
+        Returns:
+            tuple: (Figure, Axes)
+        """
+        if self.figure is None:
+            self.figure = Figure()
+            self.axes = self.figure.subplots()
+        else:
+            self.axes.clear()
+        
+        return self.figure, self.axes
+    
+    def release_plot(self):
+        """
+        Clear the shared figure and drop it, releasing the last plot's artists and data.
+        """
+        if self.figure is not None:
+            self.figure.clear()
+            self.figure = None
+            self.axes = None
+    
+    def render_plots_in_workers(self, plots):
+        """
+        Render plots in forked worker processes, one per plot.
+        
+        The pool initializer hands the visualizer and the plot arguments to the
+        workers. With fork they are inherited instead of pickled, so each task
+        only sends a method name. Each worker draws on its own shared figure.
+        
+        This is opt-in: it only pays off with several free CPUs, and forking a
+        process that runs other threads can leave a worker blocked on a lock
+        one of them held.
+        
+        Args:
+            plots (list): (plot method name, arguments) pairs
+            
+        Returns:
+            list: Paths to the saved plots, in the order of plots
+        """
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=len(plots), mp_context=context,
+                                 initializer=_init_plot_worker, initargs=(self, dict(plots))) as executor:
+            return list(executor.map(_render_plot, [method_name for method_name, _ in plots]))
     
     def load_data(self, client_stats_file, server_stats_file):
         """
@@ -55,12 +234,14 @@ class TCPVisualizer:
             tuple: (client_stats, server_stats) dictionaries
         """
         # Load client statistics
-        with open(client_stats_file, 'r') as f:
-            client_stats = json.load(f)
+        client_stats = load_statistics(client_stats_file)
         
         # Load server statistics
-        with open(server_stats_file, 'r') as f:
-            server_stats = json.load(f)
+        server_stats = load_statistics(server_stats_file)
+        
+        # Keep the series as compact typed arrays for plotting
+        _as_series_arrays(client_stats, CLIENT_SERIES_DTYPES)
+        _as_series_arrays(server_stats, SERVER_SERIES_DTYPES)
         
         return client_stats, server_stats
     
@@ -75,27 +256,26 @@ class TCPVisualizer:
         Returns:
             str: Path to saved plot
         """
-        plt.figure(figsize=(12, 6))
+        fig, ax = self.new_plot()
         
         # Plot client window size
-        plt.plot(
-            client_stats['window_timestamps'], 
-            client_stats['window_sizes'],
+        timestamps, window_sizes = _downsample(client_stats['window_timestamps'], client_stats['window_sizes'])
+        ax.plot(
+            timestamps, 
+            window_sizes,
             label='Sender Window Size',
             alpha=0.7
         )
         
         # Set plot properties
-        plt.title('TCP Sender and Receiver Window Size Over Time')
-        plt.xlabel('Time (seconds)')
-        plt.ylabel('Window Size')
-        plt.legend()
-        plt.grid(True)
+        ax.set_title('TCP Sender and Receiver Window Size Over Time')
+        ax.set_xlabel('Time (seconds)')
+        ax.set_ylabel('Window Size')
+        ax.legend()
         
         # Save plot
         output_path = os.path.join(self.output_dir, f'window_sizes_{self.timestamp}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
         
         return output_path
     
@@ -109,14 +289,13 @@ class TCPVisualizer:
         Returns:
             str: Path to saved plot
         """
-        plt.figure(figsize=(12, 6))
+        fig, ax = self.new_plot()
         
         # Get sequence numbers and timestamps
-        seq_nums = server_stats['seq_nums_received']
-        timestamps = server_stats['seq_timestamps']
+        timestamps, seq_nums = _downsample(server_stats['seq_timestamps'], server_stats['seq_nums_received'])
         
         # Create a scatter plot with small points
-        plt.scatter(
+        ax.scatter(
             timestamps, 
             seq_nums,
             s=1,  # Small point size
@@ -125,16 +304,14 @@ class TCPVisualizer:
         )
         
         # Set plot properties
-        plt.title('TCP Sequence Numbers Received Over Time')
-        plt.xlabel('Time (seconds)')
-        plt.ylabel('Sequence Number')
-        plt.legend()
-        plt.grid(True)
+        ax.set_title('TCP Sequence Numbers Received Over Time')
+        ax.set_xlabel('Time (seconds)')
+        ax.set_ylabel('Sequence Number')
+        ax.legend()
         
         # Save plot
         output_path = os.path.join(self.output_dir, f'seq_nums_received_{self.timestamp}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
         
         return output_path
     
@@ -148,31 +325,32 @@ class TCPVisualizer:
         Returns:
             str: Path to saved plot
         """
-        plt.figure(figsize=(12, 6))
+        fig, ax = self.new_plot()
         
         # Get dropped sequence numbers
-        dropped_seq_nums = server_stats['seq_nums_dropped']
-        
-        # Create histogram of dropped packets
-        plt.hist(
-            dropped_seq_nums, 
-            bins=50,
+        dropped_seq_nums = np.asarray(server_stats['seq_nums_dropped'], dtype=np.int64)
+        
+        # Create histogram of dropped packets: bin them once and draw the bins as bars
+        counts, edges = np.histogram(dropped_seq_nums, bins=50)
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align='edge',
             alpha=0.7,
             color='red',
             label='Dropped Sequence Numbers'
         )
         
         # Set plot properties
-        plt.title('TCP Sequence Numbers Dropped')
-        plt.xlabel('Sequence Number')
-        plt.ylabel('Frequency')
-        plt.legend()
-        plt.grid(True)
+        ax.set_title('TCP Sequence Numbers Dropped')
+        ax.set_xlabel('Sequence Number')
+        ax.set_ylabel('Frequency')
+        ax.legend()
         
         # Save plot
         output_path = os.path.join(self.output_dir, f'seq_nums_dropped_{self.timestamp}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
         
         return output_path
     
@@ -184,50 +362,50 @@ class TCPVisualizer:
             client_stats (dict): Client statistics
             
         Returns:
-            tuple: (DataFrame, path to saved CSV)
+            tuple: (table as a {column: values} dictionary, path to saved CSV)
         """
-        # Count retransmissions
-        retrans_counts = client_stats['retransmission_counts']
-        
-        # Create a dictionary to store counts for each retransmission number
+        # Retransmission count of every retransmitted packet (older statistics
+        # files store them as a {seq_num: count} dictionary)
+        if 'retransmission_attempt_counts' in client_stats:
+            attempt_counts = client_stats['retransmission_attempt_counts']
+        else:
+            attempt_counts = list(client_stats['retransmission_counts'].values())
+        
+        # Count packets with 1, 2, 3, and 4 retransmissions in a single pass
+        packets_per_count = np.bincount(np.asarray(attempt_counts, dtype=np.intp), minlength=5)
         retrans_table = {
-            '# of retransmissions': [],
-            '# of packets': []
+            '# of retransmissions': [1, 2, 3, 4],
+            '# of packets': packets_per_count[1:5].tolist()
         }
         
-        # Count packets with 1, 2, 3, and 4 retransmissions
-        for retrans_num in range(1, 5):
-            count = sum(1 for _, count in retrans_counts.items() if count == retrans_num)
-            retrans_table['# of retransmissions'].append(retrans_num)
-            retrans_table['# of packets'].append(count)
-        
-        # Create DataFrame
-        df = pd.DataFrame(retrans_table)
-        
         # Save to CSV
         output_path = os.path.join(self.output_dir, f'retransmission_table_{self.timestamp}.csv')
-        df.to_csv(output_path, index=False)
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(retrans_table.keys())
+            writer.writerows(zip(*retrans_table.values()))
         
-        return df, output_path
+        return retrans_table, output_path
     
-    def plot_goodput(self, server_stats):
+    def plot_goodput(self, server_stats, avg_goodput=None):
         """
         Plot goodput measurements over time.
         
         Args:
             server_stats (dict): Server statistics
+            avg_goodput (float): Average goodput, calculated from server_stats if None
             
         Returns:
             str: Path to saved plot
         """
-        plt.figure(figsize=(12, 6))
+        fig, ax = self.new_plot()
         
         # Get goodput measurements and timestamps
         goodput = server_stats['goodput_measurements']
         timestamps = server_stats['measurement_timestamps']
         
         # Plot goodput
-        plt.plot(
+        ax.plot(
             timestamps, 
             goodput,
             label='Goodput',
@@ -239,8 +417,9 @@ class TCPVisualizer:
         )
         
         # Calculate and plot average goodput
-        avg_goodput = np.mean(goodput)
-        plt.axhline(
+        if avg_goodput is None:
+            avg_goodput = float(np.mean(goodput, dtype=np.float64))
+        ax.axhline(
             y=avg_goodput, 
             color='blue', 
             linestyle='--',
@@ -248,16 +427,14 @@ class TCPVisualizer:
         )
         
         # Set plot properties
-        plt.title('Goodput Over Time')
-        plt.xlabel('Time (seconds)')
-        plt.ylabel('Goodput (received/sent)')
-        plt.legend()
-        plt.grid(True)
+        ax.set_title('Goodput Over Time')
+        ax.set_xlabel('Time (seconds)')
+        ax.set_ylabel('Goodput (received/sent)')
+        ax.legend()
         
         # Save plot
         output_path = os.path.join(self.output_dir, f'goodput_{self.timestamp}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
         
         return output_path
     
@@ -272,12 +449,28 @@ class TCPVisualizer:
         Returns:
             dict: Paths to all generated files
         """
+        # Average goodput, shared by the goodput plot and the summary (statistics
+        # may already include it)
+        avg_goodput = server_stats.get('average_goodput')
+        if avg_goodput is None:
+            avg_goodput = float(np.mean(server_stats['goodput_measurements'], dtype=np.float64))
+        
         # Generate all visualizations
-        window_plot_path = self.plot_window_sizes(client_stats, server_stats)
-        seq_nums_plot_path = self.plot_sequence_numbers(server_stats)
-        dropped_plot_path = self.plot_dropped_packets(server_stats)
-        goodput_plot_path = self.plot_goodput(server_stats)
-        retrans_df, retrans_table_path = self.create_retransmission_table(client_stats)
+        plots = [
+            ('plot_window_sizes', (client_stats, server_stats)),
+            ('plot_sequence_numbers', (server_stats,)),
+            ('plot_dropped_packets', (server_stats,)),
+            ('plot_goodput', (server_stats, avg_goodput))
+        ]
+        if self.parallel_plots:
+            plot_paths = self.render_plots_in_workers(plots)
+        else:
+            try:
+                plot_paths = [getattr(self, method_name)(*args) for method_name, args in plots]
+            finally:
+                self.release_plot()
+        window_plot_path, seq_nums_plot_path, dropped_plot_path, goodput_plot_path = plot_paths
+        retrans_table, retrans_table_path = self.create_retransmission_table(client_stats)
         
         # Create summary statistics
         summary = {
@@ -287,8 +480,8 @@ class TCPVisualizer:
             'total_packets_received': server_stats['total_packets_received'],
             'total_packets_dropped': client_stats['total_dropped'],
             'total_packets_retransmitted': client_stats['total_retransmitted'],
-            'average_goodput': np.mean(server_stats['goodput_measurements']),
-            'retransmission_table': retrans_df.to_dict(),
+            'average_goodput': avg_goodput,
+            'retransmission_table': retrans_table,
             'visualization_paths': {
                 'window_sizes': window_plot_path,
                 'sequence_numbers_received': seq_nums_plot_path,
@@ -300,11 +493,34 @@ class TCPVisualizer:
         
         # Save summary to JSON
         summary_path = os.path.join(self.output_dir, f'summary_{self.timestamp}.json')
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=4)
+        save_json(summary, summary_path)
         
         return summary
 
+def _init_plot_worker(visualizer, plots):
+    """
+    Keep the report's visualizer and plot arguments in a plot worker process.
+    
+    Args:
+        visualizer (TCPVisualizer): Visualizer generating the report
+        plots (dict): Arguments by plot method name
+    """
+    global _worker_report
+    _worker_report = (visualizer, plots)
+
+def _render_plot(method_name):
+    """
+    Render one plot of the report in a plot worker process.
+    
+    Args:
+        method_name (str): Name of the TCPVisualizer plot method
+        
+    Returns:
+        str: Path to saved plot
+    """
+    visualizer, plots = _worker_report
+    return getattr(visualizer, method_name)(*plots[method_name])
+
 def main():
     """
     Main function to run the TCP visualizer.
@@ -316,11 +532,13 @@ def main():
     parser.add_argument('--client', required=True, help='Path to client statistics JSON file')
     parser.add_argument('--server', required=True, help='Path to server statistics JSON file')
     parser.add_argument('--output', default='./output', help='Output directory for visualizations')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Render the plots in parallel worker processes (Linux, several CPUs)')
     
     args = parser.parse_args()
     
     # Create visualizer
-    visualizer = TCPVisualizer(output_dir=args.output)
+    visualizer = TCPVisualizer(output_dir=args.output, parallel_plots=args.parallel)
     
     # Load data
     client_stats, server_stats = visualizer.load_data(args.client, args.server)